@@ -1,14 +1,31 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
+from fastapi.responses import ORJSONResponse, Response
+from fastapi.utils import is_body_allowed_for_status_code
+from starlette.exceptions import HTTPException as StarletteHTTPException
 from cashflow_ingest.api.routes_ingest import router as ingest_router
 from cashflow_ingest.ingest.pipeline.memory_sink import InMemorySink
 
-app = FastAPI(title="cashflow_ingest", version="0.1.0")
+app = FastAPI(title="cashflow_ingest", version="0.1.0", default_response_class=ORJSONResponse)
 
-# Global dev sink
+# Global dev sink; the file route keeps its upload-key cache on app.state
+# too, rebuilt whenever this sink is replaced.
 app.state.storage = InMemorySink()
 
 app.include_router(ingest_router)
 
+
+@app.exception_handler(StarletteHTTPException)
+async def http_exception_handler(request: Request, exc: StarletteHTTPException) -> Response:
+    """
+    FastAPI's default handler, but serialized with orjson like every other
+    response, so error details can carry date/datetime values as-is.
+    """
+    headers = getattr(exc, "headers", None)
+    if not is_body_allowed_for_status_code(exc.status_code):
+        return Response(status_code=exc.status_code, headers=headers)
+    return ORJSONResponse({"detail": exc.detail}, status_code=exc.status_code, headers=headers)
+
+
 @app.get("/health")
 def health():
     return {"ok": True}
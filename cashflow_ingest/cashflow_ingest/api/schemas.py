@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import datetime, date
 from enum import Enum
-from pydantic import BaseModel, Field, ConfigDict, field_validator
+from typing import Any
+from pydantic import BaseModel, Field, ConfigDict
+from typing_extensions import NotRequired, TypedDict
 
 
 class Direction(str, Enum):
@@ -19,15 +22,19 @@ class Channel(str, Enum):
     COD_SETTLEMENT = "COD_SETTLEMENT"
 
 
-class CanonicalTxn(BaseModel):
+@dataclass(slots=True)
+class CanonicalTxn:
     """
     Canonical normalized transaction event.
     NOTE: In production, you persist ONLY derived aggregates, not raw txns.
     This model is for in-memory processing in ingestion.
-    """
-    model_config = ConfigDict(extra="ignore")
 
-    subject_ref: str = Field(..., description="Internal merchant reference (non-PII)")
+    A slots dataclass rather than a pydantic model: it is built once per
+    accepted row (see normalizer), so __post_init__ does the checks the
+    model used to with plain isinstance tests: str ids, a datetime (or ISO
+    string) event_ts, amount > 0, enum coercion and str-or-None optionals.
+    """
+    subject_ref: str  # Internal merchant reference (non-PII)
     merchant_id: str
     event_ts: datetime
     amount: float
@@ -38,31 +45,46 @@ class CanonicalTxn(BaseModel):
     raw_counterparty_token: str | None = None
     partial_record: bool = False
 
-    @field_validator("amount")
-    @classmethod
-    def amount_positive(cls, v: float) -> float:
-        if v <= 0:
+    def __post_init__(self) -> None:
+        if not isinstance(self.subject_ref, str) or not isinstance(self.merchant_id, str):
+            raise ValueError("subject_ref and merchant_id must be str")
+        if isinstance(self.event_ts, str):
+            self.event_ts = datetime.fromisoformat(self.event_ts)
+        elif not isinstance(self.event_ts, datetime):
+            raise ValueError("event_ts must be a datetime")
+        if self.amount <= 0:
             raise ValueError("amount must be > 0")
-        return float(v)
+        self.amount = float(self.amount)
+        if not isinstance(self.direction, Direction):
+            self.direction = Direction(self.direction)
+        if not isinstance(self.channel, Channel):
+            self.channel = Channel(self.channel)
+        for value in (self.raw_category, self.raw_narration, self.raw_counterparty_token):
+            if value is not None and not isinstance(value, str):
+                raise ValueError("raw_* fields must be str or None")
+        if not isinstance(self.partial_record, bool):
+            raise ValueError("partial_record must be a bool")
 
 
-class FeedEvent(BaseModel):
+class FeedEvent(TypedDict):
     """
     Event payload for JSON feeds.
     Extra fields are ignored to avoid raw-data retention.
+    Validated straight into plain dicts (no per-event model instance);
+    field values stay untyped so the normalizer can reject bad rows.
     """
-    model_config = ConfigDict(extra="ignore")
+    __pydantic_config__ = ConfigDict(extra="ignore")  # type: ignore[misc]
 
-    merchant_id: object
-    ts: object
-    amount: object
-    direction: object
-    channel: object
-    raw_category: object | None = None
-    raw_narration: object | None = None
-    raw_counterparty_token: object | None = None
-    payer_token: object | None = None
-    partial_record: object | None = None
+    merchant_id: Any
+    ts: Any
+    amount: Any
+    direction: Any
+    channel: Any
+    raw_category: NotRequired[Any]
+    raw_narration: NotRequired[Any]
+    raw_counterparty_token: NotRequired[Any]
+    payer_token: NotRequired[Any]
+    partial_record: NotRequired[Any]
 
 
 class FeedIngestRequest(BaseModel):
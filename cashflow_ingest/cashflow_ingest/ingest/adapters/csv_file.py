@@ -1,48 +1,133 @@
 from __future__ import annotations
 
+import csv
 import io
-from typing import Tuple
+from collections import defaultdict
+from typing import BinaryIO, Iterable, List, Tuple
 import pandas as pd
+import pyarrow as pa
+from pyarrow import csv as pa_csv
 
 
 REQUIRED_COLUMNS = {"merchant_id", "ts", "amount", "direction", "channel"}
 
+# pandas' default na_values; Arrow's own default set lacks "None" and "<NA>"
+_NA_VALUES = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN",
+    "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+]
 
-def read_csv_bytes(csv_bytes: bytes, *, max_rows: int = 2_000_000) -> pd.DataFrame:
+
+def _source(csv_bytes: bytes | BinaryIO) -> BinaryIO:
+    # Binary file objects (e.g. a spooled upload) are parsed in place, without a bytes copy.
+    if isinstance(csv_bytes, (bytes, bytearray, memoryview)):
+        return io.BytesIO(csv_bytes)
+    return csv_bytes
+
+
+def _dedupe_names(names: List[str]) -> List[str]:
     """
-    Parse CSV bytes into a DataFrame.
-    Keeps only required columns + ignores extras.
+    Duplicate header names renamed the way pandas does ("a", "a.1", "a.2"),
+    so every column can be selected by name.
     """
-    df = pd.read_csv(
-        io.BytesIO(csv_bytes),
-        dtype=str,  # parse everything as str first; normalize later
-    )
-    missing = REQUIRED_COLUMNS - set(df.columns)
+    counts: defaultdict[str, int] = defaultdict(int)
+    out = []
+    for name in names:
+        count = counts[name]
+        while count > 0:
+            counts[name] = count + 1
+            name = f"{name}.{count}"
+            count = counts[name]
+        out.append(name)
+        counts[name] = count + 1
+    return out
+
+
+def _read_as_strings(
+    csv_bytes: bytes | BinaryIO,
+    *,
+    max_rows: int,
+    columns: Iterable[str] | None = None,
+) -> pd.DataFrame:
+    """
+    Multithreaded Arrow CSV parse with every column typed as string.
+    Arrow's type inference would otherwise turn ISO timestamps into UTC
+    instants (dropping the source offset) and strip leading zeros from ids
+    before any str cast could run.
+
+    Checks run on the cheapest form available: required columns on the
+    header before the body is parsed, row count on the Arrow table before
+    the pandas conversion.
+
+    `columns` (if given) is pushed down into the reader: other columns are
+    skipped by the parser and never materialized. Required columns are always
+    kept; requested columns absent from the file are simply not present.
+
+    Arrow rejects a file with any short row outright. Such files are re-read
+    with pandas, which pads short rows with NaN so that only those rows are
+    rejected downstream (rows with extra fields still fail the file).
+    """
+    src = _source(csv_bytes)
+    start = src.tell()
+    names = _dedupe_names(next(csv.reader([src.readline().decode("utf-8-sig")]), []))
+    missing = REQUIRED_COLUMNS - set(names)
     if missing:
         raise ValueError(f"missing required columns: {sorted(missing)}")
+    body = src.tell()
+
+    header = names
+    if columns is not None:
+        wanted = REQUIRED_COLUMNS | set(columns)
+        header = [c for c in names if c in wanted]
+    try:
+        table = pa_csv.read_csv(
+            src,
+            read_options=pa_csv.ReadOptions(column_names=names),
+            parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+            convert_options=pa_csv.ConvertOptions(
+                column_types={c: pa.string() for c in header},
+                include_columns=header if columns is not None else None,
+                null_values=_NA_VALUES,
+                strings_can_be_null=True,  # NA strings -> NaN, as with pandas
+            ),
+        )
+    except pa.ArrowInvalid:
+        src.seek(body)
+        df = pd.read_csv(
+            src,
+            dtype=str,
+            header=None,
+            names=names,
+            usecols=header if columns is not None else None,
+            index_col=False,
+        )
+        if len(df) > max_rows:
+            raise ValueError(f"too many rows: {len(df)} > {max_rows}")
+        return df
+    if table.num_rows > max_rows:
+        raise ValueError(f"too many rows: {table.num_rows} > {max_rows}")
+    return table.to_pandas()
 
-    if len(df) > max_rows:
-        raise ValueError(f"too many rows: {len(df)} > {max_rows}")
 
-    # Keep required columns only (drop raw_* and any other extras)
-    df = df[list(REQUIRED_COLUMNS)].copy()
-    return df
+def read_csv_bytes(csv_bytes: bytes | BinaryIO, *, max_rows: int = 2_000_000) -> pd.DataFrame:
+    """
+    Parse CSV bytes into a DataFrame.
+    Keeps only required columns + ignores extras.
+    """
+    # Keep required columns only (raw_* and any other extras are never parsed)
+    return _read_as_strings(csv_bytes, max_rows=max_rows, columns=REQUIRED_COLUMNS)
 
 
-def read_csv_bytes_with_extras(csv_bytes: bytes, *, max_rows: int = 2_000_000) -> pd.DataFrame:
+def read_csv_bytes_with_extras(
+    csv_bytes: bytes | BinaryIO,
+    *,
+    max_rows: int = 2_000_000,
+    columns: Iterable[str] | None = None,
+) -> pd.DataFrame:
     """
     Parse CSV bytes into a DataFrame including extra columns.
     Use this when you need optional fields like record_status for filtering.
+    Pass `columns` to parse only those extras (plus required columns).
     """
-    df = pd.read_csv(
-        io.BytesIO(csv_bytes),
-        dtype=str,  # parse everything as str first; normalize later
-    )
-    missing = REQUIRED_COLUMNS - set(df.columns)
-    if missing:
-        raise ValueError(f"missing required columns: {sorted(missing)}")
-
-    if len(df) > max_rows:
-        raise ValueError(f"too many rows: {len(df)} > {max_rows}")
-
-    return df
+    # parse everything as str first; normalize later
+    return _read_as_strings(csv_bytes, max_rows=max_rows, columns=columns)
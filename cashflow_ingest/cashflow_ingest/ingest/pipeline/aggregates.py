@@ -1,28 +1,136 @@
 from __future__ import annotations
 
-from collections import defaultdict
-from datetime import date
-from typing import Dict, Iterable, Tuple
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Dict, Iterable, Mapping, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
 
 from cashflow_ingest.api.schemas import CanonicalTxn
 
 
-def compute_daily_inflow_outflow(events: Iterable[CanonicalTxn]) -> Dict[date, Tuple[float, float]]:
+def event_ts_index(values: Sequence[datetime]) -> pd.DatetimeIndex | None:
+    """
+    Convert event timestamps to a datetime64 index in one C-level pass.
+    Returns None when the timestamps mix UTC offsets (no common tz dtype);
+    callers fall back to per-object handling in that case.
+    """
+    try:
+        return pd.DatetimeIndex(values)
+    except (TypeError, ValueError):
+        return None
+
+
+def local_days(values: Sequence[datetime], ts: pd.DatetimeIndex | None = None) -> np.ndarray:
+    """
+    Calendar day of each event in its own UTC offset, as datetime64[D].
+    """
+    if ts is None:
+        ts = event_ts_index(values)
+    if ts is None:
+        return np.array([v.date() for v in values], dtype="datetime64[D]")
+    if ts.tz is not None:
+        ts = ts.tz_localize(None)
+    return ts.to_numpy().astype("datetime64[D]")
+
+
+@dataclass(frozen=True, eq=False)
+class DailyFlows:
+    """
+    Daily inflow/outflow as parallel arrays: days (datetime64[D], ascending),
+    inflow and outflow (float64). Passed to storage as-is, so no date object
+    or tuple is built per day.
+    """
+    days: np.ndarray
+    inflow: np.ndarray
+    outflow: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.days)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, DailyFlows):
+            return NotImplemented
+        return (
+            np.array_equal(self.days, other.days)
+            and np.array_equal(self.inflow, other.inflow)
+            and np.array_equal(self.outflow, other.outflow)
+        )
+
+    @classmethod
+    def from_dict(cls, daily_aggs: Mapping[date, Tuple[float, float]]) -> DailyFlows:
+        """
+        Build from the older {day: (inflow, outflow)} form.
+        """
+        n = len(daily_aggs)
+        flows = np.fromiter((v for pair in daily_aggs.values() for v in pair), dtype=np.float64, count=2 * n)
+        flows = flows.reshape(n, 2)
+        return cls(
+            days=np.array(list(daily_aggs.keys()), dtype="datetime64[D]"),
+            inflow=flows[:, 0].copy(),
+            outflow=flows[:, 1].copy(),
+        )
+
+    def as_dict(self) -> Dict[date, Tuple[float, float]]:
+        return {
+            d: (i, o) for d, i, o in zip(self.days.tolist(), self.inflow.tolist(), self.outflow.tolist())
+        }
+
+
+def daily_flows(
+    days: np.ndarray,
+    amounts: np.ndarray,
+    is_credit: np.ndarray,
+) -> DailyFlows:
+    """
+    Vectorized daily inflow/outflow over parallel arrays.
+    bincount accumulates in input order, matching a sequential Python sum.
+    """
+    uniq, inverse = np.unique(days, return_inverse=True)
+    inflow = np.bincount(inverse, weights=np.where(is_credit, amounts, 0.0), minlength=len(uniq))
+    outflow = np.bincount(inverse, weights=np.where(is_credit, 0.0, amounts), minlength=len(uniq))
+    return DailyFlows(days=uniq, inflow=inflow, outflow=outflow)
+
+
+def daily_inflow_outflow(
+    days: np.ndarray,
+    amounts: np.ndarray,
+    is_credit: np.ndarray,
+) -> Dict[date, Tuple[float, float]]:
+    """
+    daily_flows as a {day: (inflow, outflow)} dict.
+    """
+    return daily_flows(days, amounts, is_credit).as_dict()
+
+
+def compute_daily_inflow_outflow(
+    events: Iterable[CanonicalTxn] | pd.DataFrame,
+) -> Dict[date, Tuple[float, float]]:
     """
     Derived-only aggregate:
     returns {day: (inflow_total, outflow_total)} computed in-memory.
 
+    Accepts CanonicalTxn objects or a normalized frame (event_ts, amount,
+    direction columns, as produced by normalizer.normalize_df); the frame
+    path never touches per-event Python objects.
+
     Notes:
     - This uses only CanonicalTxn objects, so it's already "required columns only".
     - If/when you add Paytm-like failure fields, filter those BEFORE building CanonicalTxn.
     """
-    buckets: Dict[date, list[float]] = defaultdict(lambda: [0.0, 0.0])
-
-    for e in events:
-        d = e.event_ts.date()
-        if e.direction.value == "credit":
-            buckets[d][0] += float(e.amount)
-        else:
-            buckets[d][1] += float(e.amount)
+    if isinstance(events, pd.DataFrame):
+        if events.empty:
+            return {}
+        days = local_days(events["event_ts"])
+        amounts = events["amount"].to_numpy(dtype=np.float64)
+        is_credit = (events["direction"] == "credit").to_numpy(dtype=bool)
+        return daily_inflow_outflow(days, amounts, is_credit)
 
-    return {d: (vals[0], vals[1]) for d, vals in buckets.items()}
+    events = list(events)
+    if not events:
+        return {}
+    days = local_days([e.event_ts for e in events])
+    amounts = np.fromiter((e.amount for e in events), dtype=np.float64, count=len(events))
+    is_credit = np.fromiter((e.direction.value == "credit" for e in events), dtype=bool, count=len(events))
+    return daily_inflow_outflow(days, amounts, is_credit)
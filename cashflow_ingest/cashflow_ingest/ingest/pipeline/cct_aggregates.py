@@ -5,7 +5,7 @@ from datetime import date
 from typing import Dict, Iterable
 
 from cashflow_ingest.api.schemas import CanonicalTxn
-from cashflow_ingest.ingest.pipeline.cct_classifier import classify_cct
+from cashflow_ingest.ingest.pipeline.cct_classifier import classify_cct, cct_settings
 from cashflow_ingest.ingest.pipeline.cct_enums import CCT
 from cashflow_ingest.ingest.pipeline.semantic_classifier import classify_role_purpose
 
@@ -16,72 +16,117 @@ def _bucket_key(cct: CCT, direction: str) -> str:
     return f"{cct.value}_{suffix}"
 
 
+class DailyControlAccumulator:
+    """
+    Incremental form of aggregate_daily_control, so callers can fold it
+    into a single pass over the events (see event_scan.scan_events).
+    """
+    def __init__(self) -> None:
+        self._counts: dict[date, dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self._sums: dict[date, dict[str, float]] = defaultdict(lambda: defaultdict(float))
+        self._unique_tokens: dict[date, set[str]] = defaultdict(set)
+        self._partial_counts: dict[date, int] = defaultdict(int)
+        self._unknown_counts: dict[date, int] = defaultdict(int)
+        # Batch-level totals, kept alongside the per-day buckets
+        self.total_count = 0
+        self.unknown_total = 0
+        # Classifier config is read once per accumulator (i.e. per batch), not per event
+        self._cct_settings = cct_settings()
+
+    def add(self, e: CanonicalTxn, day: date, cct: CCT | None = None) -> None:
+        """
+        Fold one event in. `cct` is the event's precomputed class (e.g. from
+        classify_cct_batch); when omitted the event is classified here.
+        """
+        if cct is None:
+            cct = classify_cct(classify_role_purpose(e), self._cct_settings).cct
+        self.add_fields(
+            day,
+            cct,
+            e.direction.value,
+            float(e.amount),
+            e.raw_counterparty_token,
+            e.partial_record,
+        )
+
+    def add_fields(
+        self,
+        day: date,
+        cct: CCT,
+        direction: str,
+        amount: float,
+        counterparty_token: str | None,
+        partial_record: bool,
+    ) -> None:
+        """
+        Fold one already-classified row in, given as plain column values
+        (e.g. from a normalize_df frame) rather than a CanonicalTxn.
+        """
+        self.total_count += 1
+        if cct == CCT.UNKNOWN:
+            self._unknown_counts[day] += 1
+            self.unknown_total += 1
+
+        bucket = _bucket_key(cct, direction)
+        self._counts[day][bucket] += 1
+        self._sums[day][bucket] += amount
+
+        if counterparty_token:
+            self._unique_tokens[day].add(counterparty_token)
+
+        if partial_record:
+            self._partial_counts[day] += 1
+
+    def result(self) -> dict[str, dict]:
+        result: dict[str, dict] = {}
+        for d in sorted(self._counts.keys()):
+            day_str = d.isoformat()
+            counts_day = self._counts[d]
+            sums_day = self._sums[d]
+
+            # Ensure all buckets exist
+            for cct in CCT:
+                for suffix in ("IN", "OUT"):
+                    key = f"{cct.value}_{suffix}"
+                    counts_day.setdefault(key, 0)
+                    sums_day.setdefault(key, 0.0)
+
+            total_in = sum(v for k, v in sums_day.items() if k.endswith("_IN"))
+            total_out = sum(v for k, v in sums_day.items() if k.endswith("_OUT"))
+            total_flow = total_in + total_out
+
+            free_in = sums_day["FREE_IN"]
+            free_out = sums_day["FREE_OUT"]
+            free_cash_net = free_in - free_out
+
+            owner_dependency_ratio = sums_day["ARTIFICIAL_IN"] / max(1e-9, total_in)
+            pass_through_ratio = (sums_day["PASS_THROUGH_IN"] + sums_day["PASS_THROUGH_OUT"]) / max(1e-9, total_flow)
+            unknown_flow_ratio = (sums_day["UNKNOWN_IN"] + sums_day["UNKNOWN_OUT"]) / max(1e-9, total_flow)
+
+            result[day_str] = {
+                "day": day_str,
+                "counts": dict(counts_day),
+                "sums": {k: round(v, 2) for k, v in sums_day.items()},
+                "derived": {
+                    "free_cash_net": round(free_cash_net, 2),
+                    "owner_dependency_ratio": round(owner_dependency_ratio, 6),
+                    "pass_through_ratio": round(pass_through_ratio, 6),
+                    "unknown_flow_ratio": round(unknown_flow_ratio, 6),
+                    "unique_payers_count": len(self._unique_tokens[d]),
+                    "accepted_partial_rows": self._partial_counts[d],
+                    "unknown_cct_count": self._unknown_counts[d],
+                },
+            }
+
+        return result
+
+
 def aggregate_daily_control(events: Iterable[CanonicalTxn]) -> dict[str, dict]:
     """
     Build daily control aggregates:
     returns dict keyed by day string YYYY-MM-DD.
     """
-    counts: dict[date, dict[str, int]] = defaultdict(lambda: defaultdict(int))
-    sums: dict[date, dict[str, float]] = defaultdict(lambda: defaultdict(float))
-    unique_tokens: dict[date, set[str]] = defaultdict(set)
-    partial_counts: dict[date, int] = defaultdict(int)
-    unknown_counts: dict[date, int] = defaultdict(int)
-
+    acc = DailyControlAccumulator()
     for e in events:
-        d = e.event_ts.date()
-        sem = classify_role_purpose(e)
-        cct = classify_cct(sem)
-        if cct.cct == CCT.UNKNOWN:
-            unknown_counts[d] += 1
-
-        bucket = _bucket_key(cct.cct, sem.direction)
-        counts[d][bucket] += 1
-        sums[d][bucket] += float(e.amount)
-
-        if e.raw_counterparty_token:
-            unique_tokens[d].add(e.raw_counterparty_token)
-
-        if e.partial_record:
-            partial_counts[d] += 1
-
-    result: dict[str, dict] = {}
-    for d in sorted(counts.keys()):
-        day_str = d.isoformat()
-        counts_day = counts[d]
-        sums_day = sums[d]
-
-        # Ensure all buckets exist
-        for cct in CCT:
-            for suffix in ("IN", "OUT"):
-                key = f"{cct.value}_{suffix}"
-                counts_day.setdefault(key, 0)
-                sums_day.setdefault(key, 0.0)
-
-        total_in = sum(v for k, v in sums_day.items() if k.endswith("_IN"))
-        total_out = sum(v for k, v in sums_day.items() if k.endswith("_OUT"))
-        total_flow = total_in + total_out
-
-        free_in = sums_day["FREE_IN"]
-        free_out = sums_day["FREE_OUT"]
-        free_cash_net = free_in - free_out
-
-        owner_dependency_ratio = sums_day["ARTIFICIAL_IN"] / max(1e-9, total_in)
-        pass_through_ratio = (sums_day["PASS_THROUGH_IN"] + sums_day["PASS_THROUGH_OUT"]) / max(1e-9, total_flow)
-        unknown_flow_ratio = (sums_day["UNKNOWN_IN"] + sums_day["UNKNOWN_OUT"]) / max(1e-9, total_flow)
-
-        result[day_str] = {
-            "day": day_str,
-            "counts": dict(counts_day),
-            "sums": {k: round(v, 2) for k, v in sums_day.items()},
-            "derived": {
-                "free_cash_net": round(free_cash_net, 2),
-                "owner_dependency_ratio": round(owner_dependency_ratio, 6),
-                "pass_through_ratio": round(pass_through_ratio, 6),
-                "unknown_flow_ratio": round(unknown_flow_ratio, 6),
-                "unique_payers_count": len(unique_tokens[d]),
-                "accepted_partial_rows": partial_counts[d],
-                "unknown_cct_count": unknown_counts[d],
-            },
-        }
-
-    return result
+        acc.add(e, e.event_ts.date())
+    return acc.result()
@@ -1,12 +1,23 @@
 from __future__ import annotations
 
-import json
 import os
 from dataclasses import dataclass
-from typing import Iterable
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, Sequence
+
+import numpy as np
+import orjson
+import pandas as pd
 
 from cashflow_ingest.ingest.pipeline.cct_enums import CCT
-from cashflow_ingest.ingest.pipeline.semantic_classifier import TxnSemantic
+from cashflow_ingest.ingest.pipeline.keyword_scan import KeywordScanner
+from cashflow_ingest.ingest.pipeline.semantic_classifier import (
+    TxnSemantic,
+    keyword_blob,
+    purpose_classes,
+    text_blobs,
+)
 
 
 @dataclass(frozen=True)
@@ -16,8 +27,29 @@ class CCTResult:
     rules_fired: list[str]
 
 
+@dataclass(frozen=True)
+class CCTSettings:
+    """
+    Classifier config from the environment, resolved once per batch.
+    """
+    min_conf: float
+    ambiguity_delta: float
+    overrides: Mapping[str, float]
+
+
 def _env_float(name: str, default: float) -> float:
-    raw = os.getenv(name, str(default)).strip().lower()
+    return _parse_env_float(os.getenv(name, str(default)), default)
+
+
+def _threshold_overrides() -> Mapping[str, float]:
+    return _parse_threshold_overrides(os.getenv("CCT_THRESHOLDS_JSON", ""))
+
+
+# Parsed env values are cached on the raw string: a lookup costs one environ
+# read, and changes to the environment are still honoured.
+@lru_cache(maxsize=32)
+def _parse_env_float(raw: str, default: float) -> float:
+    raw = raw.strip().lower()
     if raw in {"", "none", "null"}:
         return default
     try:
@@ -26,29 +58,67 @@ def _env_float(name: str, default: float) -> float:
         return default
 
 
-def _threshold_overrides() -> dict[str, float]:
-    raw = os.getenv("CCT_THRESHOLDS_JSON", "").strip()
+@lru_cache(maxsize=8)
+def _parse_threshold_overrides(raw: str) -> Mapping[str, float]:
+    # Read-only view, since the cached mapping is shared between callers
+    raw = raw.strip()
     if not raw:
-        return {}
+        return MappingProxyType({})
     try:
-        parsed = json.loads(raw)
+        parsed = orjson.loads(raw)
         if isinstance(parsed, dict):
-            return {str(k).upper(): float(v) for k, v in parsed.items()}
+            return MappingProxyType({str(k).upper(): float(v) for k, v in parsed.items()})
     except Exception:
-        return {}
-    return {}
+        return MappingProxyType({})
+    return MappingProxyType({})
+
+
+def cct_settings() -> CCTSettings:
+    """
+    Current MIN_CCT_CONFIDENCE / AMBIGUITY_DELTA / CCT_THRESHOLDS_JSON config.
+    """
+    return CCTSettings(
+        min_conf=_env_float("MIN_CCT_CONFIDENCE", 0.70),
+        ambiguity_delta=_env_float("AMBIGUITY_DELTA", 0.05),
+        overrides=_threshold_overrides(),
+    )
 
 
-def _threshold_for(cct: CCT, default_min: float, overrides: dict[str, float]) -> float:
+def _threshold_for(cct: CCT, default_min: float, overrides: Mapping[str, float]) -> float:
     return overrides.get(cct.value, default_min)
 
 
-def _text(val: str | None) -> str:
-    return (val or "").strip().lower()
+# (keywords, candidate, confidence, rule), in evaluation order:
+# hard rules (highest weight), then category- and narration-based rules (medium weight).
+_KEYWORD_RULES: tuple[tuple[tuple[str, ...], CCT, float, str], ...] = (
+    (("settlement", "gateway", "pg", "fee", "commission"), CCT.PASS_THROUGH, 0.90, "HARD_SETTLEMENT_FEE"),
+    (("refund", "reversal", "chargeback"), CCT.PASS_THROUGH, 0.88, "HARD_REFUND_REVERSAL"),
+    (("owner", "self", "capital", "withdrawal", "infusion", "director"), CCT.ARTIFICIAL, 0.90, "HARD_OWNER_TRANSFER"),
+    (("rent", "utility", "electricity", "water", "emi", "gst", "tax"), CCT.CONSTRAINED, 0.75, "CAT_OBLIGATION"),
+    (("inventory", "stock", "wholesale", "supplier", "procure"), CCT.CONSTRAINED, 0.75, "CAT_INVENTORY"),
+    (("sale", "sales", "invoice", "pos", "order", "revenue"), CCT.FREE, 0.75, "CAT_SALE"),
+    (("reimbursement", "insurance", "claim", "subsidy", "grant"), CCT.CONDITIONAL, 0.72, "CAT_REIMBURSEMENT"),
+    (("cashback", "promo"), CCT.CONDITIONAL, 0.70, "NAR_CASHBACK_PROMO"),
+    (("settle", "netting"), CCT.PASS_THROUGH, 0.70, "NAR_SETTLEMENT"),
+)
+_KEYWORD_SCANNER = KeywordScanner([keywords for keywords, _, _, _ in _KEYWORD_RULES])
+
+# Channel + direction heuristics (low weight)
+_NETBANK_DEBIT = (CCT.CONSTRAINED, 0.60, "HEUR_NETBANK_DEBIT")
+_NETBANK_CHANNELS = frozenset({"NET_BANKING", "BANK"})
+_CONSUMER_CREDIT = (CCT.FREE, 0.60, "HEUR_CONSUMER_CREDIT")
+_CONSUMER_CHANNELS = frozenset({"UPI", "CARD", "WALLET"})
 
+# Purpose-based fallback (medium weight); at most one fires per event.
+_PURPOSE_RULES: tuple[tuple[frozenset[str], tuple[CCT, float, str]], ...] = (
+    (frozenset({"SALE"}), (CCT.FREE, 0.70, "PURPOSE_SALE")),
+    (frozenset({"INVENTORY", "OPEX_OR_STATUTORY"}), (CCT.CONSTRAINED, 0.70, "PURPOSE_OBLIGATION")),
+    (frozenset({"SETTLEMENT_OR_FEE", "REFUND_OR_REVERSAL"}), (CCT.PASS_THROUGH, 0.70, "PURPOSE_PASS_THROUGH")),
+    (frozenset({"OWNER_TRANSFER"}), (CCT.ARTIFICIAL, 0.70, "PURPOSE_OWNER_TRANSFER")),
+    (frozenset({"REIMBURSEMENT"}), (CCT.CONDITIONAL, 0.68, "PURPOSE_REIMBURSEMENT")),
+)
 
-def _contains_any(text: str, keywords: Iterable[str]) -> bool:
-    return any(k in text for k in keywords)
+_FALLBACK = (CCT.UNKNOWN, 0.50, "PURPOSE_UNKNOWN")
 
 
 def _candidates(sem: TxnSemantic) -> list[tuple[CCT, float, str]]:
@@ -57,75 +127,56 @@ def _candidates(sem: TxnSemantic) -> list[tuple[CCT, float, str]]:
     """
     candidates: list[tuple[CCT, float, str]] = []
 
-    cat = _text(sem.raw_category)
-    nar = _text(sem.raw_narration)
-    blob = f"{cat} {nar}".strip()
-
-    # Hard rules (highest weight)
-    if _contains_any(blob, ["settlement", "gateway", "pg", "fee", "commission"]):
-        candidates.append((CCT.PASS_THROUGH, 0.90, "HARD_SETTLEMENT_FEE"))
-    if _contains_any(blob, ["refund", "reversal", "chargeback"]):
-        candidates.append((CCT.PASS_THROUGH, 0.88, "HARD_REFUND_REVERSAL"))
-    if _contains_any(blob, ["owner", "self", "capital", "withdrawal", "infusion", "director"]):
-        candidates.append((CCT.ARTIFICIAL, 0.90, "HARD_OWNER_TRANSFER"))
-
-    # Category-based rules (medium weight)
-    if _contains_any(blob, ["rent", "utility", "electricity", "water", "emi", "gst", "tax"]):
-        candidates.append((CCT.CONSTRAINED, 0.75, "CAT_OBLIGATION"))
-    if _contains_any(blob, ["inventory", "stock", "wholesale", "supplier", "procure"]):
-        candidates.append((CCT.CONSTRAINED, 0.75, "CAT_INVENTORY"))
-    if _contains_any(blob, ["sale", "sales", "invoice", "pos", "order", "revenue"]):
-        candidates.append((CCT.FREE, 0.75, "CAT_SALE"))
-    if _contains_any(blob, ["reimbursement", "insurance", "claim", "subsidy", "grant"]):
-        candidates.append((CCT.CONDITIONAL, 0.72, "CAT_REIMBURSEMENT"))
-
-    # Narration-based rules (medium weight)
-    if _contains_any(blob, ["cashback", "promo"]):
-        candidates.append((CCT.CONDITIONAL, 0.70, "NAR_CASHBACK_PROMO"))
-    if _contains_any(blob, ["settle", "netting"]):
-        candidates.append((CCT.PASS_THROUGH, 0.70, "NAR_SETTLEMENT"))
-
-    # Channel + direction heuristics (low weight)
+    blob = sem.keyword_blob
+    if blob is None:
+        blob = keyword_blob(sem.raw_category, sem.raw_narration)
+
+    matched = _KEYWORD_SCANNER.mask(blob)
+    for i, (_, cct, confidence, rule) in enumerate(_KEYWORD_RULES):
+        if matched >> i & 1:
+            candidates.append((cct, confidence, rule))
+
     direction = sem.direction.lower()
     channel = sem.channel.upper()
-    if direction == "debit" and channel in {"NET_BANKING", "BANK"}:
-        candidates.append((CCT.CONSTRAINED, 0.60, "HEUR_NETBANK_DEBIT"))
-    if direction == "credit" and channel in {"UPI", "CARD", "WALLET"}:
-        candidates.append((CCT.FREE, 0.60, "HEUR_CONSUMER_CREDIT"))
-
-    # Purpose-based fallback (medium weight)
-    purpose = sem.purpose_class
-    if purpose == "SALE":
-        candidates.append((CCT.FREE, 0.70, "PURPOSE_SALE"))
-    elif purpose in {"INVENTORY", "OPEX_OR_STATUTORY"}:
-        candidates.append((CCT.CONSTRAINED, 0.70, "PURPOSE_OBLIGATION"))
-    elif purpose in {"SETTLEMENT_OR_FEE", "REFUND_OR_REVERSAL"}:
-        candidates.append((CCT.PASS_THROUGH, 0.70, "PURPOSE_PASS_THROUGH"))
-    elif purpose == "OWNER_TRANSFER":
-        candidates.append((CCT.ARTIFICIAL, 0.70, "PURPOSE_OWNER_TRANSFER"))
-    elif purpose == "REIMBURSEMENT":
-        candidates.append((CCT.CONDITIONAL, 0.68, "PURPOSE_REIMBURSEMENT"))
+    if direction == "debit" and channel in _NETBANK_CHANNELS:
+        candidates.append(_NETBANK_DEBIT)
+    if direction == "credit" and channel in _CONSUMER_CHANNELS:
+        candidates.append(_CONSUMER_CREDIT)
+
+    for purposes, candidate in _PURPOSE_RULES:
+        if sem.purpose_class in purposes:
+            candidates.append(candidate)
+            break
 
     if not candidates:
-        candidates.append((CCT.UNKNOWN, 0.50, "PURPOSE_UNKNOWN"))
+        candidates.append(_FALLBACK)
 
     return candidates
 
 
-def classify_cct(sem: TxnSemantic) -> CCTResult:
+def classify_cct(sem: TxnSemantic, settings: CCTSettings | None = None) -> CCTResult:
     """
     Apply rule candidates and resolve ambiguity.
+    Pass `settings` (see cct_settings) when classifying many events, so the
+    environment is read once per batch rather than per event.
     """
-    min_conf = _env_float("MIN_CCT_CONFIDENCE", 0.70)
-    ambiguity_delta = _env_float("AMBIGUITY_DELTA", 0.05)
-    overrides = _threshold_overrides()
+    if settings is None:
+        settings = cct_settings()
+    min_conf = settings.min_conf
+    ambiguity_delta = settings.ambiguity_delta
+    overrides = settings.overrides
 
     cands = _candidates(sem)
-    # pick top by confidence
-    cands_sorted = sorted(cands, key=lambda x: x[1], reverse=True)
-    top = cands_sorted[0]
-    if len(cands_sorted) > 1:
-        second = cands_sorted[1]
+    # pick top and runner-up by confidence in one pass; strict ">" keeps the
+    # earlier candidate on ties, exactly as a stable descending sort would
+    top = cands[0]
+    second = None
+    for cand in cands[1:]:
+        if cand[1] > top[1]:
+            second, top = top, cand
+        elif second is None or cand[1] > second[1]:
+            second = cand
+    if second is not None:
         if top[0] != second[0] and abs(top[1] - second[1]) <= ambiguity_delta:
             return CCTResult(cct=CCT.UNKNOWN, confidence=top[1], rules_fired=[top[2], second[2]])
 
@@ -134,3 +185,101 @@ def classify_cct(sem: TxnSemantic) -> CCTResult:
         return CCTResult(cct=CCT.UNKNOWN, confidence=top[1], rules_fired=[top[2]])
 
     return CCTResult(cct=top[0], confidence=top[1], rules_fired=[top[2]])
+
+
+def classify_cct_batch(
+    categories: Sequence[str | None],
+    narrations: Sequence[str | None],
+    directions: Sequence[str],
+    channels: Sequence[str],
+    settings: CCTSettings | None = None,
+) -> list[CCTResult]:
+    """
+    classify_cct over parallel columns, with the same results per row.
+
+    A result depends only on (category, narration, direction, channel), and
+    batches repeat the same few combinations, so each distinct combination
+    is classified once; rows that repeat it share the same CCTResult.
+    """
+    if settings is None:
+        settings = cct_settings()
+    index: dict[tuple, int] = {}
+    codes = [index.setdefault(key, len(index)) for key in zip(categories, narrations, directions, channels)]
+    if not index:
+        return []
+    unique_categories, unique_narrations, unique_directions, unique_channels = zip(*index)
+    results = _classify_distinct(unique_categories, unique_narrations, unique_directions, unique_channels, settings)
+    return [results[code] for code in codes]
+
+
+def _classify_distinct(
+    categories: Sequence[str | None],
+    narrations: Sequence[str | None],
+    directions: Sequence[str],
+    channels: Sequence[str],
+    settings: CCTSettings,
+) -> list[CCTResult]:
+    """
+    Each rule is evaluated once for the whole batch (a single keyword scan
+    per text covers all keyword rules), giving an (events x rules)
+    confidence matrix; top and runner-up candidates are resolved with
+    argmax. Rule columns are in the scalar evaluation order, so argmax's
+    first-max tie-break matches the stable sort in classify_cct.
+    """
+    min_conf = settings.min_conf
+    ambiguity_delta = settings.ambiguity_delta
+    overrides = settings.overrides
+
+    blobs = text_blobs(categories, narrations)
+    n = len(blobs)
+    purposes = purpose_classes(blobs)
+    direction = pd.Series(directions, dtype=object).str.lower().to_numpy(dtype=object)
+    channel = pd.Series(channels, dtype=object).str.upper()
+
+    fired: list[np.ndarray] = []
+    rules: list[tuple[CCT, float, str]] = []
+    keyword_hits = _KEYWORD_SCANNER.hits(blobs)
+    for i, (_, cct, confidence, rule) in enumerate(_KEYWORD_RULES):
+        fired.append(keyword_hits[:, i])
+        rules.append((cct, confidence, rule))
+    fired.append((direction == "debit") & channel.isin(_NETBANK_CHANNELS).to_numpy(dtype=bool))
+    rules.append(_NETBANK_DEBIT)
+    fired.append((direction == "credit") & channel.isin(_CONSUMER_CHANNELS).to_numpy(dtype=bool))
+    rules.append(_CONSUMER_CREDIT)
+    for purpose_set, candidate in _PURPOSE_RULES:
+        fired.append(np.isin(purposes, list(purpose_set)))
+        rules.append(candidate)
+    fired.append(~np.logical_or.reduce(fired))
+    rules.append(_FALLBACK)
+
+    rule_conf = np.array([confidence for _, confidence, _ in rules], dtype=np.float64)
+    rule_cct = np.array([list(CCT).index(cct) for cct, _, _ in rules], dtype=np.intp)
+    conf = np.where(np.column_stack(fired), rule_conf, -np.inf)
+
+    rows = np.arange(n)
+    top = conf.argmax(axis=1)
+    top_conf = conf[rows, top]
+    conf[rows, top] = -np.inf
+    second = conf.argmax(axis=1)
+    second_conf = conf[rows, second]
+
+    ambiguous = (
+        np.isfinite(second_conf)
+        & (rule_cct[top] != rule_cct[second])
+        & (np.abs(top_conf - second_conf) <= ambiguity_delta)
+    )
+    rule_threshold = np.array([_threshold_for(cct, min_conf, overrides) for cct, _, _ in rules])
+    threshold = rule_threshold[top]
+    below = (threshold > 0) & (top_conf < threshold)
+
+    results: list[CCTResult] = []
+    for t, s2, conf_t, is_ambiguous, is_below in zip(
+        top.tolist(), second.tolist(), top_conf.tolist(), ambiguous.tolist(), below.tolist()
+    ):
+        if is_ambiguous:
+            results.append(CCTResult(cct=CCT.UNKNOWN, confidence=conf_t, rules_fired=[rules[t][2], rules[s2][2]]))
+        elif is_below:
+            results.append(CCTResult(cct=CCT.UNKNOWN, confidence=conf_t, rules_fired=[rules[t][2]]))
+        else:
+            results.append(CCTResult(cct=rules[t][0], confidence=conf_t, rules_fired=[rules[t][2]]))
+    return results
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+from cashflow_ingest.api.schemas import CanonicalTxn
+from cashflow_ingest.ingest.pipeline.aggregates import DailyFlows, daily_flows, event_ts_index, local_days
+from cashflow_ingest.ingest.pipeline.cct_aggregates import DailyControlAccumulator
+from cashflow_ingest.ingest.pipeline.cct_classifier import classify_cct_batch
+
+
+@dataclass(frozen=True)
+class EventScan:
+    min_ts: datetime
+    max_ts: datetime
+    # Calendar dates of min_ts/max_ts, computed once for range checks and keys
+    min_day: date
+    max_day: date
+    payer_token_present: bool
+    daily: DailyFlows
+    daily_control: dict[str, dict]
+    cct_unknown_rate: float
+
+
+def scan_events(events: Iterable[CanonicalTxn] | pd.DataFrame) -> EventScan:
+    """
+    Single pass over accepted events producing everything the ingest routes
+    need: inferred range, payer-token presence, daily inflow/outflow,
+    daily control aggregates and the batch CCT unknown rate.
+
+    Timestamps are converted to datetime64 once; range and day bucketing are
+    array reductions. CCT classification runs once over the whole batch.
+
+    Accepts CanonicalTxn objects or the normalizer's accepted-rows frame;
+    the frame is read column-wise and no event objects are built.
+    """
+    if isinstance(events, pd.DataFrame):
+        frame = events
+        if frame.empty:
+            raise ValueError("no events to scan")
+        ts_values = frame["event_ts"]
+        ts = event_ts_index(ts_values)
+        amounts = frame["amount"].to_numpy(dtype=np.float64)
+        directions = frame["direction"].tolist()
+        is_credit = (frame["direction"] == "credit").to_numpy(dtype=bool)
+        tokens = frame["raw_counterparty_token"].tolist()
+        partial = frame["partial_record"].tolist()
+        classified = classify_cct_batch(
+            frame["raw_category"].tolist(),
+            frame["raw_narration"].tolist(),
+            directions,
+            frame["channel"].tolist(),
+        )
+    else:
+        events = list(events)
+        if not events:
+            raise ValueError("no events to scan")
+        n = len(events)
+        ts_values = [e.event_ts for e in events]
+        ts = event_ts_index(ts_values)
+        amounts = np.fromiter((e.amount for e in events), dtype=np.float64, count=n)
+        directions = [e.direction.value for e in events]
+        is_credit = np.fromiter((d == "credit" for d in directions), dtype=bool, count=n)
+        tokens = [e.raw_counterparty_token for e in events]
+        partial = [e.partial_record for e in events]
+        classified = classify_cct_batch(
+            [e.raw_category for e in events],
+            [e.raw_narration for e in events],
+            directions,
+            [e.channel.value for e in events],
+        )
+    payer_token_present = any(tokens)
+
+    days = local_days(ts_values, ts)
+    if ts is None:
+        min_ts, max_ts = min(ts_values), max(ts_values)
+    else:
+        min_ts, max_ts = ts.min().to_pydatetime(), ts.max().to_pydatetime()
+
+    control = DailyControlAccumulator()
+    for day, result, direction, amount, token, is_partial in zip(
+        days.tolist(), classified, directions, amounts.tolist(), tokens, partial
+    ):
+        control.add_fields(day, result.cct, direction, amount, token, is_partial)
+
+    return EventScan(
+        min_ts=min_ts,
+        max_ts=max_ts,
+        min_day=min_ts.date(),
+        max_day=max_ts.date(),
+        payer_token_present=payer_token_present,
+        daily=daily_flows(days, amounts, is_credit),
+        daily_control=control.result(),
+        cct_unknown_rate=control.unknown_total / control.total_count,
+    )
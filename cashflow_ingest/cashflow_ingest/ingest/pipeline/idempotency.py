@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 import hashlib
-from datetime import datetime
+from datetime import date, datetime
 from typing import Iterable, Tuple
 
+import pandas as pd
+
 from cashflow_ingest.api.schemas import CanonicalTxn
+from cashflow_ingest.ingest.pipeline.aggregates import event_ts_index
 
 
 def sha256_hex(data: bytes) -> str:
@@ -22,15 +25,35 @@ def compute_batch_idempotency_key(
     """
     Stable key: subject + source + file hash + inferred date range.
     """
-    min_date = min_ts.date() if hasattr(min_ts, "date") else min_ts
-    max_date = max_ts.date() if hasattr(max_ts, "date") else max_ts
-    payload = f"{subject_ref}|{source}|{file_hash_hex}|{min_date}|{max_date}".encode("utf-8")
-    return sha256_hex(payload)
+    min_date = min_ts.date() if isinstance(min_ts, datetime) else min_ts
+    max_date = max_ts.date() if isinstance(max_ts, datetime) else max_ts
+    # One join + encode, hashed in a single update; same bytes as the original
+    # f-string, without going through format() for each field.
+    payload = "|".join((subject_ref, source, file_hash_hex, min_date.isoformat(), max_date.isoformat()))
+    return sha256_hex(payload.encode("utf-8"))
 
 
-def infer_min_max_ts(events: Iterable[CanonicalTxn]) -> Tuple[datetime, datetime]:
-    ts = [e.event_ts for e in events]
-    return min(ts), max(ts)
+def infer_min_max_ts(events: Iterable[CanonicalTxn] | pd.DataFrame) -> Tuple[datetime, datetime]:
+    """
+    Earliest and latest event_ts. Accepts CanonicalTxn objects or a
+    normalized frame (event_ts column), reduced as datetime64 in C.
+    """
+    if isinstance(events, pd.DataFrame):
+        ts = events["event_ts"]
+    else:
+        ts = [e.event_ts for e in events]
+    idx = event_ts_index(ts)
+    if idx is not None:
+        return idx.min().to_pydatetime(), idx.max().to_pydatetime()
+    # Mixed offsets: one pass tracking both ends instead of min() + max()
+    it = iter(ts)
+    lo = hi = next(it)
+    for t in it:
+        if t < lo:
+            lo = t
+        elif t > hi:
+            hi = t
+    return lo, hi
 
 
 def compute_feed_idempotency_key(
@@ -38,8 +61,8 @@ def compute_feed_idempotency_key(
     subject_ref: str,
     source: str,
     watermark_ts: datetime,
-    min_ts: datetime,
-    max_ts: datetime,
+    min_ts: date | datetime,
+    max_ts: date | datetime,
     event_count: int,
     payload_hash_hex: str,
 ) -> str:
@@ -47,8 +70,13 @@ def compute_feed_idempotency_key(
     Stable key for JSON feeds:
     subject + source + watermark + range + count + payload hash.
     """
-    payload = (
-        f"{subject_ref}|{source}|{watermark_ts.isoformat()}|"
-        f"{min_ts.isoformat()}|{max_ts.isoformat()}|{event_count}|{payload_hash_hex}"
-    ).encode("utf-8")
-    return sha256_hex(payload)
+    payload = "|".join((
+        subject_ref,
+        source,
+        watermark_ts.isoformat(),
+        min_ts.isoformat(),
+        max_ts.isoformat(),
+        str(event_count),
+        payload_hash_hex,
+    ))
+    return sha256_hex(payload.encode("utf-8"))
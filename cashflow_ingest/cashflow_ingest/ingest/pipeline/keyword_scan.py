@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import re
+from typing import Iterable, Sequence
+
+import numpy as np
+import pandas as pd
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """
+    Regex for a keyword set, factored as a trie ("settle(?:ment)?") so the
+    engine dispatches on the first character instead of trying each keyword.
+    """
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node: dict) -> str:
+        alts = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not alts:
+            return ""
+        body = alts[0] if len(alts) == 1 else "(?:" + "|".join(alts) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
+class KeywordScanner:
+    """
+    Single-pass substring matcher for several keyword groups, equivalent to
+    running `any(k in text for k in group)` for every group.
+
+    One compiled regex reports, at each text position, the longest keyword
+    starting there (zero-width lookahead, so matches may overlap). Every
+    keyword maps to a bitmask of the groups of all keywords it contains
+    ("settlement" also carries the bit of a "settle" group), so shorter
+    keywords hidden inside a longer match still fire their groups.
+    """
+
+    def __init__(self, groups: Sequence[Iterable[str]]) -> None:
+        groups = [tuple(g) for g in groups]
+        if len(groups) > 63:
+            raise ValueError("at most 63 keyword groups")
+        keywords = sorted({k for g in groups for k in g})
+        self._pattern = re.compile(f"(?=({_trie_pattern(keywords)}))")
+        self._group_bits = np.array([1 << i for i in range(len(groups))], dtype=np.int64)
+        self._mask = {
+            k: sum(1 << i for i, g in enumerate(groups) if any(j in k for j in g))
+            for k in keywords
+        }
+
+    def mask(self, text: str) -> int:
+        """
+        Bitmask of the groups with at least one keyword in `text` (bit i = group i).
+        """
+        m = 0
+        for keyword in self._pattern.findall(text):
+            m |= self._mask[keyword]
+        return m
+
+    def hits(self, texts: pd.Series) -> np.ndarray:
+        """
+        (len(texts), n_groups) bool matrix: whether each text matches each group.
+        """
+        found = texts.reset_index(drop=True).str.findall(self._pattern).explode().dropna()
+        masks = np.zeros(len(texts), dtype=np.int64)
+        np.bitwise_or.at(masks, found.index.to_numpy(dtype=np.intp), found.map(self._mask).to_numpy(dtype=np.int64))
+        return (masks[:, None] & self._group_bits) != 0
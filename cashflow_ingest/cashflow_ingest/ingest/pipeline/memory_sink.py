@@ -1,7 +1,14 @@
 from __future__ import annotations
+import threading
+from collections import defaultdict
+from dataclasses import dataclass
 from datetime import date
 from typing import Dict, Tuple
 
+import pandas as pd
+import pyarrow as pa
+
+from cashflow_ingest.ingest.pipeline.aggregates import DailyFlows
 from cashflow_ingest.ingest.pipeline.storage_port import StoragePort
 
 
@@ -9,15 +16,52 @@ class DuplicateBatchError(Exception):
     pass
 
 
+@dataclass(frozen=True, slots=True)
+class BatchRecord:
+    batch_id: int
+    subject_ref: str
+    subject_ref_version: str | None
+    source: str
+    filename_hash: str
+    file_ext: str
+    rows_accepted: int
+    rows_rejected: int
+    range_start: date
+    range_end: date
+    cct_unknown_rate: float
+
+
+@dataclass(frozen=True, slots=True)
+class DailyControlRecord:
+    subject_ref: str
+    day: str
+    control: dict
+
+
+_DAILY_FLOW_SCHEMA = pa.schema([
+    ("day", pa.date32()),
+    ("inflow", pa.float64()),
+    ("outflow", pa.float64()),
+])
+
+
 class InMemorySink(StoragePort):
     """
     Development-only sink.
     NOT for production.
+    Ingest runs in a threadpool, so mutations are guarded by a lock.
     """
     def __init__(self) -> None:
-        self._batches = {}
-        self._daily = []
+        self._batches: dict[str, BatchRecord] = {}
+        # Daily inflow/outflow kept columnar: one Arrow RecordBatch per persisted batch
+        self._daily_flows: dict[str, list[pa.RecordBatch]] = defaultdict(list)
+        self._daily_control: list[DailyControlRecord] = []
         self._next_batch_id = 1
+        self._lock = threading.Lock()
+
+    def has_batch(self, idempotency_key: str) -> bool:
+        with self._lock:
+            return idempotency_key in self._batches
 
     def persist_batch(
         self,
@@ -35,40 +79,47 @@ class InMemorySink(StoragePort):
         range_end: date,
         cct_unknown_rate: float,
     ) -> int:
-        if idempotency_key in self._batches:
-            raise DuplicateBatchError(f"batch already ingested: {idempotency_key}")
-
-        batch_id = self._next_batch_id
-        self._next_batch_id += 1
-
-        self._batches[idempotency_key] = {
-            "batch_id": batch_id,
-            "subject_ref": subject_ref,
-            "subject_ref_version": subject_ref_version,
-            "source": source,
-            "filename_hash": filename_hash,
-            "file_ext": file_ext,
-            "rows_accepted": rows_accepted,
-            "rows_rejected": rows_rejected,
-            "range_start": range_start,
-            "range_end": range_end,
-            "cct_unknown_rate": round(float(cct_unknown_rate), 6),
-        }
-        return batch_id
+        with self._lock:
+            if idempotency_key in self._batches:
+                raise DuplicateBatchError(f"batch already ingested: {idempotency_key}")
+
+            batch_id = self._next_batch_id
+            self._next_batch_id += 1
+
+            self._batches[idempotency_key] = BatchRecord(
+                batch_id=batch_id,
+                subject_ref=subject_ref,
+                subject_ref_version=subject_ref_version,
+                source=source,
+                filename_hash=filename_hash,
+                file_ext=file_ext,
+                rows_accepted=rows_accepted,
+                rows_rejected=rows_rejected,
+                range_start=range_start,
+                range_end=range_end,
+                cct_unknown_rate=round(float(cct_unknown_rate), 6),
+            )
+            return batch_id
 
     def persist_daily_aggregates(
         self,
         *,
         subject_ref: str,
-        daily_aggs: Dict[date, Tuple[float, float]],
+        daily_aggs: DailyFlows | Dict[date, Tuple[float, float]],
     ) -> None:
-        for day, (inflow, outflow) in daily_aggs.items():
-            self._daily.append({
-                "subject_ref": subject_ref,
-                "day": day,
-                "inflow": round(inflow, 2),
-                "outflow": round(outflow, 2),
-            })
+        if not isinstance(daily_aggs, DailyFlows):
+            daily_aggs = DailyFlows.from_dict(daily_aggs)
+        record = pa.RecordBatch.from_arrays(
+            [
+                pa.array(daily_aggs.days, pa.date32()),
+                # round() per value: a subject has at most a few hundred days
+                pa.array([round(v, 2) for v in daily_aggs.inflow.tolist()], pa.float64()),
+                pa.array([round(v, 2) for v in daily_aggs.outflow.tolist()], pa.float64()),
+            ],
+            schema=_DAILY_FLOW_SCHEMA,
+        )
+        with self._lock:
+            self._daily_flows[subject_ref].append(record)
 
     def persist_daily_control_aggregates(
         self,
@@ -76,9 +127,16 @@ class InMemorySink(StoragePort):
         subject_ref: str,
         daily_control_aggs: Dict[str, dict],
     ) -> None:
-        for day, payload in daily_control_aggs.items():
-            self._daily.append({
-                "subject_ref": subject_ref,
-                "day": day,
-                "control": payload,
-            })
+        rows = [
+            DailyControlRecord(subject_ref=subject_ref, day=day, control=payload)
+            for day, payload in daily_control_aggs.items()
+        ]
+        with self._lock:
+            self._daily_control.extend(rows)
+
+    def daily_aggregates(self, subject_ref: str) -> pd.DataFrame:
+        """Persisted daily inflow/outflow rows for a subject (Arrow-backed columns)."""
+        with self._lock:
+            batches = list(self._daily_flows.get(subject_ref, ()))
+        table = pa.Table.from_batches(batches, schema=_DAILY_FLOW_SCHEMA)
+        return table.to_pandas(types_mapper=pd.ArrowDtype)
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterable
+from typing import Sequence
+
+import numpy as np
+import pandas as pd
 
 from cashflow_ingest.api.schemas import CanonicalTxn
+from cashflow_ingest.ingest.pipeline.keyword_scan import KeywordScanner
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TxnSemantic:
     subject_ref: str
     event_ts: object
@@ -18,14 +22,79 @@ class TxnSemantic:
     raw_counterparty_token: str | None
     role_class: str
     purpose_class: str
+    # Lowercased "category narration" text, built once and reused by the CCT rules
+    keyword_blob: str | None = None
 
 
 def _text(val: str | None) -> str:
     return (val or "").strip().lower()
 
 
-def _contains_any(text: str, keywords: Iterable[str]) -> bool:
-    return any(k in text for k in keywords)
+def keyword_blob(raw_category: str | None, raw_narration: str | None) -> str:
+    """
+    The text both classifiers match keywords against.
+    """
+    return f"{_text(raw_category)} {_text(raw_narration)}".strip()
+
+
+# (keywords, role_class, purpose_class); the first matching group wins.
+_ROLE_PURPOSE_RULES: tuple[tuple[tuple[str, ...], str, str], ...] = (
+    (("owner", "self", "capital", "withdrawal", "infusion"), "OWNER", "OWNER_TRANSFER"),
+    (("supplier", "inventory", "stock", "procure"), "SUPPLIER", "INVENTORY"),
+    (("rent", "utility", "electricity", "water", "emi", "gst", "tax"), "OBLIGATION", "OPEX_OR_STATUTORY"),
+    (("refund", "chargeback", "reversal"), "PLATFORM", "REFUND_OR_REVERSAL"),
+    (("settlement", "gateway", "pg", "fee", "commission"), "PLATFORM", "SETTLEMENT_OR_FEE"),
+    (("sale", "sales", "invoice", "pos", "order", "revenue"), "CUSTOMER", "SALE"),
+    (("reimbursement", "insurance", "claim", "subsidy", "grant"), "THIRD_PARTY", "REIMBURSEMENT"),
+)
+_ROLE_PURPOSE_SCANNER = KeywordScanner([keywords for keywords, _, _ in _ROLE_PURPOSE_RULES])
+# Labels by rule code; the extra last code is "no rule matched".
+_ROLE_LABELS = np.array([role for _, role, _ in _ROLE_PURPOSE_RULES] + ["UNKNOWN"], dtype=object)
+_PURPOSE_LABELS = np.array([purpose for _, _, purpose in _ROLE_PURPOSE_RULES] + ["UNKNOWN"], dtype=object)
+
+
+def text_blobs(categories: Sequence[str | None], narrations: Sequence[str | None]) -> pd.Series:
+    """
+    Batch form of the "category narration" blob the classifiers match on.
+    Keywords contain no spaces, so the outer strip() of the scalar blob is not needed.
+    """
+    cat = pd.Series(categories, dtype=object).fillna("").str.strip().str.lower()
+    nar = pd.Series(narrations, dtype=object).fillna("").str.strip().str.lower()
+    return (cat + " " + nar).astype(object)
+
+
+def rule_codes(blobs: pd.Series) -> np.ndarray:
+    """
+    int8 code of the first matching role/purpose rule per blob
+    (len(_ROLE_PURPOSE_RULES) when none match). Labels are looked up from
+    the codes only when strings are needed.
+    """
+    hits = _ROLE_PURPOSE_SCANNER.hits(blobs)
+    # argmax returns the first True column; the all-True sentinel column
+    # catches rows where no rule fired.
+    with_default = np.column_stack([hits, np.ones(len(hits), dtype=bool)])
+    return with_default.argmax(axis=1).astype(np.int8)
+
+
+def purpose_classes(blobs: pd.Series) -> np.ndarray:
+    """
+    purpose_class for each blob, matching classify_role_purpose.
+    """
+    return _PURPOSE_LABELS[rule_codes(blobs)]
+
+
+def classify_role_purpose_bulk(df: pd.DataFrame) -> tuple[pd.Series, pd.Series]:
+    """
+    role_class and purpose_class for every row of a frame with raw_category
+    and raw_narration columns (e.g. normalize_df's output), without building
+    a TxnSemantic per row. Both Series share the frame's index.
+    """
+    blobs = text_blobs(df["raw_category"].tolist(), df["raw_narration"].tolist())
+    codes = rule_codes(blobs)
+    return (
+        pd.Series(_ROLE_LABELS[codes], index=df.index, dtype=object, name="role_class"),
+        pd.Series(_PURPOSE_LABELS[codes], index=df.index, dtype=object, name="purpose_class"),
+    )
 
 
 def classify_role_purpose(txn: CanonicalTxn) -> TxnSemantic:
@@ -33,34 +102,17 @@ def classify_role_purpose(txn: CanonicalTxn) -> TxnSemantic:
     Ephemeral classification using optional category/narration signals.
     Outputs role_class and purpose_class (strings).
     """
-    cat = _text(txn.raw_category)
-    nar = _text(txn.raw_narration)
-    blob = f"{cat} {nar}".strip()
+    blob = keyword_blob(txn.raw_category, txn.raw_narration)
 
     role_class = "UNKNOWN"
     purpose_class = "UNKNOWN"
 
-    if _contains_any(blob, ["owner", "self", "capital", "withdrawal", "infusion"]):
-        role_class = "OWNER"
-        purpose_class = "OWNER_TRANSFER"
-    elif _contains_any(blob, ["supplier", "inventory", "stock", "procure"]):
-        role_class = "SUPPLIER"
-        purpose_class = "INVENTORY"
-    elif _contains_any(blob, ["rent", "utility", "electricity", "water", "emi", "gst", "tax"]):
-        role_class = "OBLIGATION"
-        purpose_class = "OPEX_OR_STATUTORY"
-    elif _contains_any(blob, ["refund", "chargeback", "reversal"]):
-        role_class = "PLATFORM"
-        purpose_class = "REFUND_OR_REVERSAL"
-    elif _contains_any(blob, ["settlement", "gateway", "pg", "fee", "commission"]):
-        role_class = "PLATFORM"
-        purpose_class = "SETTLEMENT_OR_FEE"
-    elif _contains_any(blob, ["sale", "sales", "invoice", "pos", "order", "revenue"]):
-        role_class = "CUSTOMER"
-        purpose_class = "SALE"
-    elif _contains_any(blob, ["reimbursement", "insurance", "claim", "subsidy", "grant"]):
-        role_class = "THIRD_PARTY"
-        purpose_class = "REIMBURSEMENT"
+    matched = _ROLE_PURPOSE_SCANNER.mask(blob)
+    for i, (_, role, purpose) in enumerate(_ROLE_PURPOSE_RULES):
+        if matched >> i & 1:
+            role_class = role
+            purpose_class = purpose
+            break
 
     return TxnSemantic(
         subject_ref=txn.subject_ref,
@@ -73,4 +125,5 @@ def classify_role_purpose(txn: CanonicalTxn) -> TxnSemantic:
         raw_counterparty_token=txn.raw_counterparty_token,
         role_class=role_class,
         purpose_class=purpose_class,
+        keyword_blob=blob,
     )
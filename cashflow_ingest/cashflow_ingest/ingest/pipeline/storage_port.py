@@ -3,8 +3,14 @@ from abc import ABC, abstractmethod
 from datetime import date
 from typing import Dict, Tuple
 
+from cashflow_ingest.ingest.pipeline.aggregates import DailyFlows
+
 
 class StoragePort(ABC):
+    @abstractmethod
+    def has_batch(self, idempotency_key: str) -> bool:
+        """True if a batch with this idempotency key was already persisted"""
+
     @abstractmethod
     def persist_batch(
         self,
@@ -29,9 +35,9 @@ class StoragePort(ABC):
         self,
         *,
         subject_ref: str,
-        daily_aggs: Dict[date, Tuple[float, float]],
+        daily_aggs: DailyFlows | Dict[date, Tuple[float, float]],
     ) -> None:
-        """daily_aggs: day -> (inflow, outflow)"""
+        """daily_aggs: DailyFlows arrays, or a legacy day -> (inflow, outflow) dict"""
 
     @abstractmethod
     def persist_daily_control_aggregates(
@@ -37,25 +37,35 @@ Paytm-like:
 - pharmacy_paytm_like_{scenario}_v5.csv
 Minimal:
 - pharmacy_minimal_{scenario}_v5.csv
+With --gzip each CSV is written as .csv.gz (gzip level 1).
+With --format parquet (or both) each file is (also) written as .parquet.
 
 Usage
 -----
-python pharmacy_data_generator_v5.py --out_dir . --days 365 --start_date 2025-11-05 --seed 42
+python pharmacy_data_generator_v5.py --out_dir . --days 365 --start_date 2025-11-05 --seed 42 --jobs 3
 
-Dependencies: numpy, pandas
+Dependencies: numpy, pyarrow
 """
 
 from __future__ import annotations
 
 import argparse
+import csv
+import gzip
+import io
 import math
 import random
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime, timedelta, time
-from typing import Dict, List, Tuple, Optional
+from datetime import datetime, timedelta
+from operator import itemgetter
+from typing import List, Tuple, Optional
 
 import numpy as np
-import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
 
 
 # -----------------------------
@@ -118,6 +128,19 @@ MISS_RATE_FRAUD = 0.08
 LATE_REFILL_PROB_STRESS = 0.40
 LATE_REFILL_DELAY_DAYS = (5, 18)
 
+# Log-space medians for the lognormal amount draws, computed once
+LN_240 = math.log(240)
+LN_500 = math.log(500)
+LN_720 = math.log(720)
+LN_2600 = math.log(2600)
+LN_4000 = math.log(4000)
+LN_6000 = math.log(6000)
+LN_6500 = math.log(6500)
+LN_12000 = math.log(12000)
+LN_28000 = math.log(28000)
+LN_38000 = math.log(38000)
+LN_45000 = math.log(45000)
+
 
 # -----------------------------
 # Utilities
@@ -126,35 +149,64 @@ def parse_date(s: str) -> datetime:
     return datetime.strptime(s, "%Y-%m-%d")
 
 
-def set_seeds(seed: int) -> None:
-    random.seed(seed)
-    np.random.seed(seed)
+def scenario_seed(seed: int, scenario: str) -> np.random.SeedSequence:
+    """
+    Root of a scenario's RNG streams: the same for a given seed and
+    scenario whichever process generates it.
+    """
+    return np.random.SeedSequence([seed, SCENARIOS.index(scenario)])
+
+
+def day_rngs(seq: np.random.SeedSequence) -> Tuple[np.random.Generator, random.Random]:
+    """
+    A day's two independent streams: a NumPy Generator for array draws,
+    and a random.Random for the per-row scalar draws, where it is ~9x
+    cheaper per call than a Generator.
+    """
+    np_seq, py_seq = seq.spawn(2)
+    return np.random.default_rng(np_seq), random.Random(py_seq.generate_state(4).tobytes())
+
+
+# Timestamp pieces by hour and by second within the hour, so a timestamp
+# is two table lookups and a concatenation instead of per-row formatting.
+_TS_HOUR = np.array([f"T{h:02d}:" for h in range(24)], dtype=object)
+_TS_MIN_SEC = np.array(
+    [f"{m:02d}:{s:02d}{TZ_OFFSET}" for m in range(60) for s in range(60)], dtype=object
+)
 
 
-def iso_ts(d: datetime, t: time, tz: str) -> str:
-    return datetime.combine(d.date(), t).strftime(f"%Y-%m-%dT%H:%M:%S{tz}")
+def iso_timestamps(day: str, seconds: np.ndarray) -> List[str]:
+    """
+    ISO-8601 timestamps at TZ_OFFSET for `seconds` since midnight on `day`
+    (the date's "%Y-%m-%d", formatted once per day by the caller).
+    """
+    hour, rest = np.divmod(seconds, 3600)
+    return [day + hh + mm_ss for hh, mm_ss in zip(_TS_HOUR[hour].tolist(), _TS_MIN_SEC[rest].tolist())]
 
 
-def sample_times(n: int) -> List[time]:
+def sample_times(n: int, rng: np.random.Generator) -> np.ndarray:
     """
     Pharmacy time-of-day: peaks in late morning (9-14) and evening (17-22).
+    Returned sorted, as seconds since midnight.
     """
-    out: List[time] = []
-    for _ in range(n):
-        r = random.random()
-        if r < 0.45:  # evening peak
-            hour = int(np.clip(np.random.normal(19.3, 1.0), 17, 22))
-            minute = int(np.clip(np.random.normal(18, 16), 0, 59))
-        elif r < 0.75:  # late morning peak
-            hour = int(np.clip(np.random.normal(11.2, 0.9), 9, 14))
-            minute = int(np.clip(np.random.normal(22, 18), 0, 59))
-        else:  # uniform spread
-            hour = random.randint(9, 22)
-            minute = random.randint(0, 59)
-        second = random.randint(0, 59)
-        out.append(time(hour, minute, second))
-    out.sort()
-    return out
+    r = rng.random(n)
+    evening = r < 0.45
+    morning = (r >= 0.45) & (r < 0.75)
+    spread = ~(evening | morning)
+
+    hour = np.empty(n, dtype=np.int64)
+    minute = np.empty(n, dtype=np.int64)
+    hour[evening] = np.clip(rng.normal(19.3, 1.0, evening.sum()), 17, 22)
+    minute[evening] = np.clip(rng.normal(18, 16, evening.sum()), 0, 59)
+    hour[morning] = np.clip(rng.normal(11.2, 0.9, morning.sum()), 9, 14)
+    minute[morning] = np.clip(rng.normal(22, 18, morning.sum()), 0, 59)
+    hour[spread] = rng.integers(9, 23, spread.sum())
+    minute[spread] = rng.integers(0, 60, spread.sum())
+    second = rng.integers(0, 60, n)
+
+    seconds = hour * 3600 + minute * 60 + second
+    seconds.sort()
+    return seconds
 
 
 def seasonal_multiplier(d: datetime) -> float:
@@ -195,7 +247,21 @@ def volume_mu(d: datetime, scenario: str) -> int:
     return base
 
 
-def pick_channel_for_retail(n: int, fraud_like: bool) -> List[str]:
+_RETAIL_CHANNELS = [CHANNEL_UPI, CHANNEL_CARD, CHANNEL_WALLET, CHANNEL_BANK]
+# Normalized once here rather than on every call
+_RETAIL_P = np.array([0.64, 0.22, 0.12, 0.02], dtype=np.float64)
+_RETAIL_P /= _RETAIL_P.sum()
+_RETAIL_P_FRAUD = np.array([0.78, 0.12, 0.08, 0.02], dtype=np.float64)
+_RETAIL_P_FRAUD /= _RETAIL_P_FRAUD.sum()
+# Retail row kinds (sale, settlement, owner infusion, reimbursement) by
+# cumulative probability: 84% / 8% / 6.5% / 1.5%
+_RETAIL_KIND_EDGES = np.array([0.84, 0.92, 0.985], dtype=np.float64)
+# Platform fee debits
+_FEE_CHANNELS = [CHANNEL_BANK, CHANNEL_WALLET, CHANNEL_CARD]
+_FEE_P = np.array([0.55, 0.25, 0.20], dtype=np.float64)
+
+
+def pick_channel_for_retail(n: int, fraud_like: bool, rng: np.random.Generator) -> List[str]:
     """
     Retail customer receipts:
     - UPI dominates
@@ -203,37 +269,27 @@ def pick_channel_for_retail(n: int, fraud_like: bool) -> List[str]:
     - some WALLET
     - BANK rare
     """
-    if fraud_like:
-        probs = {CHANNEL_UPI: 0.78, CHANNEL_CARD: 0.12, CHANNEL_WALLET: 0.08, CHANNEL_BANK: 0.02}
-    else:
-        probs = {CHANNEL_UPI: 0.64, CHANNEL_CARD: 0.22, CHANNEL_WALLET: 0.12, CHANNEL_BANK: 0.02}
+    p = _RETAIL_P_FRAUD if fraud_like else _RETAIL_P
+    return rng.choice(_RETAIL_CHANNELS, size=n, p=p).tolist()
 
-    ch = list(probs.keys())
-    p = np.array(list(probs.values()), dtype=float)
-    p = p / p.sum()
-    return list(np.random.choice(ch, size=n, p=p))
 
-
-def gen_credit_amounts(n: int, fraud_like: bool) -> List[float]:
+def gen_credit_amounts(n: int, fraud_like: bool, rng: np.random.Generator) -> List[float]:
     """
     Mixture distribution: small OTC + medium Rx + rare high ticket.
     Fraud-like: more round amounts.
+    All n amounts are drawn in one batch per component and picked by bucket.
     """
-    amts: List[float] = []
-    for _ in range(n):
-        r = random.random()
-        if r < 0.60:
-            a = np.random.lognormal(mean=math.log(240), sigma=0.55)
-        elif r < 0.95:
-            a = np.random.lognormal(mean=math.log(720), sigma=0.45)
-        else:
-            a = np.random.lognormal(mean=math.log(2600), sigma=0.35)
+    r = rng.random(n)
+    small = rng.lognormal(mean=LN_240, sigma=0.55, size=n)
+    medium = rng.lognormal(mean=LN_720, sigma=0.45, size=n)
+    high = rng.lognormal(mean=LN_2600, sigma=0.35, size=n)
+    a = np.where(r < 0.60, small, np.where(r < 0.95, medium, high))
 
-        if fraud_like and random.random() < 0.55:
-            a = round(a / 50) * 50
+    if fraud_like:
+        rounded = rng.random(n) < 0.55
+        a = np.where(rounded, np.round(a / 50) * 50, a)
 
-        amts.append(round(float(a), 2))
-    return amts
+    return np.round(a, 2).tolist()
 
 
 # -----------------------------
@@ -247,68 +303,121 @@ _zipf_weights = 1 / (_zipf_ranks ** 1.15)
 _zipf_weights = _zipf_weights / _zipf_weights.sum()
 
 
-def sample_customer_token() -> str:
+def _cdf(p: np.ndarray) -> np.ndarray:
+    # Normalized as Generator.choice does with p.
+    cdf = np.cumsum(p, dtype=np.float64)
+    cdf /= cdf[-1]
+    return cdf
+
+
+class TokenSampler:
     """
-    55% from chronic pool (repeat behavior), 45% from long tail.
+    Bulk counterparty-token draws: one inverse-CDF lookup per pool and batch
+    instead of one call per row. Pools and their CDFs are fixed at
+    construction, so Generator.choice's per-call p validation and cumsum
+    are skipped.
     """
-    if random.random() < 0.55:
-        return str(np.random.choice(CHRONIC, p=_zipf_weights))
-    return random.choice(CUSTOMERS[N_CHRONIC:])
 
+    def __init__(self) -> None:
+        self._chronic = np.array(CHRONIC)
+        self._chronic_cdf = _cdf(_zipf_weights)
+        self._long_tail = np.array(CUSTOMERS[N_CHRONIC:])
+        self._suppliers = np.array(SUPPLIERS)
+        self._supplier_cdf = _cdf(np.array([0.45, 0.30, 0.18, 0.07]))
+        self._platforms = np.array(PLATFORMS)
+        self._platform_cdf = _cdf(np.array([0.65, 0.20, 0.15]))  # Paytm > PhonePe > bank
+
+    @staticmethod
+    def _choice(pool: np.ndarray, cdf: np.ndarray, n: int, rng: np.random.Generator) -> np.ndarray:
+        return pool[cdf.searchsorted(rng.random(n), side="right")]
 
-def sample_supplier_token() -> str:
-    probs = np.array([0.45, 0.30, 0.18, 0.07], dtype=float)
-    return str(np.random.choice(SUPPLIERS, p=probs))
+    def sample_customers(self, n: int, rng: np.random.Generator) -> List[str]:
+        """
+        55% from chronic pool (repeat behavior), 45% from long tail.
+        """
+        chronic = rng.random(n) < 0.55
+        repeat = self._choice(self._chronic, self._chronic_cdf, n, rng)
+        tail = rng.choice(self._long_tail, size=n)
+        return np.where(chronic, repeat, tail).tolist()
 
+    def sample_suppliers(self, n: int, rng: np.random.Generator) -> List[str]:
+        return self._choice(self._suppliers, self._supplier_cdf, n, rng).tolist()
 
-def sample_platform_token() -> str:
-    probs = np.array([0.65, 0.20, 0.15], dtype=float)  # Paytm > PhonePe > bank
-    return str(np.random.choice(PLATFORMS, p=probs))
+    def sample_platforms(self, n: int, rng: np.random.Generator) -> List[str]:
+        return self._choice(self._platforms, self._platform_cdf, n, rng).tolist()
 
 
-def sample_utility_token(kind: str) -> str:
+TOKENS = TokenSampler()
+
+
+def sample_utility_token(kind: str, py_rng: random.Random) -> str:
     mapping = {
         "rent": "cp_utility_rent",
         "electricity": "cp_utility_electricity",
         "telecom": "cp_utility_telecom",
     }
-    return mapping.get(kind, random.choice(UTILITIES))
+    return mapping.get(kind, py_rng.choice(UTILITIES))
 
 
 # -----------------------------
 # Negative testing injection (Paytm-like only; drop in ingestion)
 # -----------------------------
+# Columns of a row's failure draws, in the order maybe_inject_failure checks them.
+_DRAW_INSUFF, _DRAW_TIMEOUT, _DRAW_NETWORK, _DRAW_INVALID, _DRAW_PARTIAL, _DRAW_SUB, _DRAW_TOKEN = range(7)
+
+
+def failure_draws(n: int, rng: np.random.Generator) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    One block of uniform draws for n rows (shape (n, 7)), plus a mask of
+    rows where no failure check can fire. Those rows are plain SUCCESS
+    without calling maybe_inject_failure; the mask ignores the direction
+    and token conditions, which can only rule failures out.
+    """
+    draws = rng.random((n, 7))
+    clean = (
+        (draws[:, _DRAW_INSUFF] >= FAIL_RATE_INSUFFICIENT_FUNDS)
+        & (draws[:, _DRAW_TIMEOUT] >= FAIL_RATE_TIMEOUT)
+        & (draws[:, _DRAW_NETWORK] >= FAIL_RATE_NETWORK)
+        & (draws[:, _DRAW_INVALID] >= INVALID_TOKEN_RATE)
+        & (draws[:, _DRAW_PARTIAL] >= PARTIAL_RECORD_RATE)
+    )
+    return draws, clean
+
+
 def maybe_inject_failure(
     amount: float,
     direction: str,
     channel: str,
     raw_counterparty_token: str,
+    rands: np.ndarray,
 ) -> Tuple[str, str, int, float, str]:
     """
     Returns: (record_status, failure_reason, partial_record, amount_out, token_out)
 
+    `rands` is the row's slice of a failure_draws block.
+
     Rules:
     - Failed transactions should NOT affect underwriting features: ingestion should ignore non-SUCCESS.
     - Partial records simulate parsing/transport truncation in optional fields.
     - Invalid token simulates a token not belonging to known pools.
     """
     # Insufficient funds mostly relevant for debits
-    if direction == "debit" and random.random() < FAIL_RATE_INSUFFICIENT_FUNDS:
+    if direction == "debit" and rands[_DRAW_INSUFF] < FAIL_RATE_INSUFFICIENT_FUNDS:
         return (RECORD_STATUS_FAIL_INSUFF, "insufficient_funds", 0, amount, raw_counterparty_token)
 
-    if random.random() < FAIL_RATE_TIMEOUT:
-        partial = 1 if random.random() < 0.7 else 0
+    if rands[_DRAW_TIMEOUT] < FAIL_RATE_TIMEOUT:
+        partial = 1 if rands[_DRAW_SUB] < 0.7 else 0
         return (RECORD_STATUS_FAIL_TIMEOUT, "timeout", partial, amount, raw_counterparty_token)
 
-    if random.random() < FAIL_RATE_NETWORK:
-        partial = 1 if random.random() < 0.6 else 0
+    if rands[_DRAW_NETWORK] < FAIL_RATE_NETWORK:
+        partial = 1 if rands[_DRAW_SUB] < 0.6 else 0
         return (RECORD_STATUS_FAIL_NETWORK, "network_failure", partial, amount, raw_counterparty_token)
 
-    if raw_counterparty_token and random.random() < INVALID_TOKEN_RATE:
-        bad = f"cp_invalid_{random.randint(100000, 999999)}"
+    if raw_counterparty_token and rands[_DRAW_INVALID] < INVALID_TOKEN_RATE:
+        bad = f"cp_invalid_{100000 + int(rands[_DRAW_TOKEN] * 900000)}"
         return (RECORD_STATUS_INVALID_TOKEN, "unknown_counterparty_token", 0, amount, bad)
 
-    if random.random() < PARTIAL_RECORD_RATE:
+    if rands[_DRAW_PARTIAL] < PARTIAL_RECORD_RATE:
         return (RECORD_STATUS_SUCCESS, "partial_record", 1, amount, raw_counterparty_token)
 
     return (RECORD_STATUS_SUCCESS, "", 0, amount, raw_counterparty_token)
@@ -317,24 +426,44 @@ def maybe_inject_failure(
 # -----------------------------
 # Chronic refill modeling (EPHEMERAL tokens only)
 # -----------------------------
-def init_chronic_refill_state(start_date: datetime, chronic_tokens: List[str]) -> Dict[str, datetime]:
+_REFILL_CHANNELS = [CHANNEL_UPI, CHANNEL_CARD, CHANNEL_WALLET]
+_REFILL_P = np.array([0.62, 0.28, 0.10], dtype=np.float64)
+
+
+@dataclass
+class RefillState:
+    """
+    Chronic tokens and each one's next due date as a proleptic ordinal
+    (date.toordinal()), updated in place day by day.
+    """
+    tokens: np.ndarray
+    due: np.ndarray
+
+
+def init_chronic_refill_state(
+    start_date: datetime,
+    chronic_tokens: List[str],
+    rng: np.random.Generator,
+) -> RefillState:
     """
     Next due date per chronic token. Purely internal state during generation.
     """
-    state: Dict[str, datetime] = {}
-    for tok in chronic_tokens:
-        first_due = start_date + timedelta(days=random.randint(0, 20))
-        state[tok] = first_due
-    return state
+    n = len(chronic_tokens)
+    due = start_date.toordinal() + rng.integers(0, 21, size=n).astype(np.int64)
+    return RefillState(tokens=np.array(chronic_tokens, dtype=object), due=due)
 
 
 def emit_chronic_refills_for_day(
     d: datetime,
     scenario: str,
-    refill_state: Dict[str, datetime],
+    refill_state: RefillState,
+    rng: np.random.Generator,
 ) -> List[Tuple[str, float, str]]:
     """
     Returns list of (counterparty_token, amount, channel) for refill purchases on day d.
+
+    Decisions for all tokens in their due window are drawn as arrays; only
+    the tokens that actually refill become tuples.
     """
     if scenario == "stress":
         miss_rate = MISS_RATE_STRESS
@@ -343,33 +472,31 @@ def emit_chronic_refills_for_day(
     else:
         miss_rate = MISS_RATE_BASE
 
-    out: List[Tuple[str, float, str]] = []
-    for tok, due in list(refill_state.items()):
-        # due-window: +/- 2 days around due date
-        if abs((d.date() - due.date()).days) <= 2:
-            # miss?
-            if random.random() < miss_rate:
-                # stress: some become late refills (catch-up)
-                if scenario == "stress" and random.random() < LATE_REFILL_PROB_STRESS:
-                    delay = random.randint(*LATE_REFILL_DELAY_DAYS)
-                    refill_state[tok] = due + timedelta(days=delay)
-                else:
-                    # skip cycle -> push to next cycle
-                    refill_state[tok] = due + timedelta(days=random.randint(*REFILL_CYCLE_DAYS))
-                continue
-
-            # refill occurs with some probability
-            if random.random() > CHRONIC_REFILL_PROB:
-                refill_state[tok] = due + timedelta(days=random.randint(*REFILL_CYCLE_DAYS))
-                continue
-
-            amt = round(float(np.random.uniform(*CHRONIC_REFILL_AMOUNT)), 2)
-            ch = str(np.random.choice([CHANNEL_UPI, CHANNEL_CARD, CHANNEL_WALLET], p=[0.62, 0.28, 0.10]))
-            out.append((tok, amt, ch))
-
-            refill_state[tok] = due + timedelta(days=random.randint(*REFILL_CYCLE_DAYS))
-
-    return out
+    # due-window: +/- 2 days around due date
+    due = refill_state.due
+    idx = np.flatnonzero(np.abs(d.toordinal() - due) <= 2)
+    k = len(idx)
+    if k == 0:
+        return []
+
+    u = rng.random((k, 3))
+    missed = u[:, 0] < miss_rate
+    # stress: some misses become late refills (catch-up); other misses skip a cycle
+    late = missed & (scenario == "stress") & (u[:, 1] < LATE_REFILL_PROB_STRESS)
+    # refill occurs with some probability
+    refilled = ~missed & (u[:, 2] <= CHRONIC_REFILL_PROB)
+
+    cycle = rng.integers(REFILL_CYCLE_DAYS[0], REFILL_CYCLE_DAYS[1] + 1, size=k)
+    delay = rng.integers(LATE_REFILL_DELAY_DAYS[0], LATE_REFILL_DELAY_DAYS[1] + 1, size=k)
+    due[idx] += np.where(late, delay, cycle)
+
+    n_refill = int(refilled.sum())
+    if n_refill == 0:
+        return []
+    amts = np.round(rng.uniform(*CHRONIC_REFILL_AMOUNT, size=n_refill), 2)
+    chans = rng.choice(_REFILL_CHANNELS, size=n_refill, p=_REFILL_P)
+    toks = refill_state.tokens[idx[refilled]]
+    return list(zip(toks.tolist(), amts.tolist(), chans.tolist()))
 
 
 # -----------------------------
@@ -394,247 +521,395 @@ PAYTM_LIKE_COLUMNS = [
 
 MINIMAL_COLUMNS = ["merchant_id", "ts", "amount", "direction", "channel"]
 
+# Retail kinds: 0 sale, 1 platform settlement, 2 owner infusion, 3 conditional reimbursement
+_RETAIL_ROLE = np.array(["customer", "platform", "owner", "platform"], dtype=object)
+_RETAIL_PURPOSE = np.array(["sale", "settlement", "owner_transfer", "reimbursement"], dtype=object)
+_RETAIL_CCT = np.array(["FREE", "PASS_THROUGH", "ARTIFICIAL", "CONDITIONAL"], dtype=object)
+# Settlement rails: BANK 55%, WALLET 25%, COD 20%
+_SETTLEMENT_EDGES = np.array([0.55, 0.80], dtype=np.float64)
+_SETTLEMENT_CHANNELS = np.array([CHANNEL_BANK, CHANNEL_WALLET, CHANNEL_COD_SETTLEMENT], dtype=object)
+_SETTLEMENT_NOTES = np.array(["Settlement (bank)", "Settlement (wallet)", "COD settlement"], dtype=object)
+
+
+def _pick_tags(tags: List[str], u: np.ndarray) -> np.ndarray:
+    return np.array(tags, dtype=object)[(u * len(tags)).astype(np.intp)]
+
+
+def generate_retail_rows(
+    day: str,
+    n: int,
+    fraud_like: bool,
+    rng: np.random.Generator,
+    py_rng: random.Random,
+) -> List[List[str]]:
+    """
+    The day's n retail receipt rows. Every column is drawn for all n rows
+    at once and filled per row kind by mask; only rows with a failure
+    draw go through maybe_inject_failure one by one.
+    """
+    timestamps = iso_timestamps(day, sample_times(n, rng))
+    kinds = np.searchsorted(_RETAIL_KIND_EDGES, rng.random(n), side="right")
+    settle, owner, cond = kinds == 1, kinds == 2, kinds == 3
+    tag_u = rng.random(n)
+
+    # Retail sale -> FREE (the default for every column)
+    amts = np.asarray(gen_credit_amounts(n, fraud_like=fraud_like, rng=rng))
+    chans = np.array(pick_channel_for_retail(n, fraud_like=fraud_like, rng=rng), dtype=object)
+    cats = _pick_tags(CUSTOMER_TAGS, tag_u)
+    notes = np.full(n, "Purchase", dtype=object)
+    cps = np.array(TOKENS.sample_customers(n, rng), dtype=object)
+
+    # Platform settlement -> PASS_THROUGH (includes WALLET + COD_SETTLEMENT)
+    platform_tokens = np.array(TOKENS.sample_platforms(n, rng), dtype=object)
+    cps[settle] = platform_tokens[settle]
+    cats[settle] = "Settlement"
+    amts = np.where(settle, np.round(amts * rng.uniform(2.2, 4.0, n), 2), amts)
+    rail = np.searchsorted(_SETTLEMENT_EDGES, rng.random(n), side="right")[settle]
+    chans[settle] = _SETTLEMENT_CHANNELS[rail]
+    notes[settle] = _SETTLEMENT_NOTES[rail]
+
+    # Owner infusion -> ARTIFICIAL
+    k = int(owner.sum())
+    cats[owner] = _pick_tags(TRANSFER_TAGS, tag_u[owner])
+    notes[owner] = "Transfer"
+    cps[owner] = OWNER
+    chans[owner] = np.where(rng.random(k) < 0.7, CHANNEL_BANK, CHANNEL_UPI).astype(object)
+    amts[owner] = np.round(rng.lognormal(mean=LN_45000, sigma=0.35, size=k), 2)
+
+    # Conditional reimbursements -> CONDITIONAL
+    k = int(cond.sum())
+    cats[cond] = _pick_tags(CONDITIONAL_TAGS, tag_u[cond])
+    notes[cond] = "Reimbursement"
+    cps[cond] = "cp_conditional_001"
+    chans[cond] = CHANNEL_BANK
+    amts[cond] = np.round(rng.lognormal(mean=LN_6000, sigma=0.30, size=k), 2)
+
+    amts_l, chans_l, cats_l, notes_l, cps_l = (a.tolist() for a in (amts, chans, cats, notes, cps))
+    status = [RECORD_STATUS_SUCCESS] * n
+    reason = [""] * n
+    partial = [0] * n
+    draws, clean = failure_draws(n, rng)
+    for i in np.flatnonzero(~clean).tolist():
+        status[i], reason[i], partial[i], amts_l[i], cps_l[i] = maybe_inject_failure(
+            amount=amts_l[i],
+            direction="credit",
+            channel=chans_l[i],
+            raw_counterparty_token=cps_l[i],
+            rands=draws[i],
+        )
+        if partial[i] == 1:
+            if py_rng.random() < 0.7:
+                notes_l[i] = ""
+            if py_rng.random() < 0.4:
+                cats_l[i] = ""
+
+    return [
+        [MERCHANT_ID, ts, amt, "credit", ch, cat, note, cp, role, purpose, cct, st, fr, pr]
+        for ts, amt, ch, cat, note, cp, role, purpose, cct, st, fr, pr in zip(
+            timestamps, amts_l, chans_l, cats_l, notes_l, cps_l,
+            _RETAIL_ROLE[kinds].tolist(), _RETAIL_PURPOSE[kinds].tolist(), _RETAIL_CCT[kinds].tolist(),
+            status, reason, partial,
+        )
+    ]
+
 
 def generate_day(
     d: datetime,
     scenario: str,
-    refill_state: Dict[str, datetime],
+    refill_purchases: List[Tuple[str, float, str]],
+    rng: np.random.Generator,
+    py_rng: random.Random,
 ) -> List[List[str]]:
     """
     Returns Paytm-like rows with ephemeral context + hints + failure fields.
+
+    Draws come only from the day's own streams (see day_rngs), and the
+    chronic refills are decided by the caller, so days are independent.
     """
     fraud_like = scenario == "fraud_like"
     mu = volume_mu(d, scenario)
-    credit_n = int(np.clip(np.random.normal(mu, 10), 30, 170))
+    credit_n = int(np.clip(rng.normal(mu, 10), 30, 170))
+    day = d.strftime("%Y-%m-%d")
 
     rows: List[List[str]] = []
 
     # 0) Explicit chronic refill purchases (adds realistic cadence + misses/late)
-    refill_purchases = emit_chronic_refills_for_day(d, scenario, refill_state)
-    refill_times = sample_times(len(refill_purchases)) if refill_purchases else []
-    for (tok, amt, ch), t in zip(refill_purchases, refill_times):
+    refill_ts = iso_timestamps(day, sample_times(len(refill_purchases), rng))
+    draws, clean = failure_draws(len(refill_purchases), rng)
+    for i, ((tok, amt, ch), ts) in enumerate(zip(refill_purchases, refill_ts)):
         direction = "credit"
         role, purpose, cct = "customer", "sale", "FREE"
         cat, note = "Pharmacy", "Refill"
 
-        record_status, failure_reason, partial_record, amt_out, tok_out = maybe_inject_failure(
-            amount=float(amt),
-            direction=direction,
-            channel=ch,
-            raw_counterparty_token=tok,
-        )
-        amt = amt_out
-        tok = tok_out
+        if clean[i]:
+            record_status, failure_reason, partial_record = RECORD_STATUS_SUCCESS, "", 0
+        else:
+            record_status, failure_reason, partial_record, amt, tok = maybe_inject_failure(
+                amount=float(amt),
+                direction=direction,
+                channel=ch,
+                raw_counterparty_token=tok,
+                rands=draws[i],
+            )
 
         if partial_record == 1:
-            if random.random() < 0.7:
+            if py_rng.random() < 0.7:
                 note = ""
-            if random.random() < 0.4:
+            if py_rng.random() < 0.4:
                 cat = ""
 
-        ts = iso_ts(d, t, TZ_OFFSET)
         rows.append([
-            MERCHANT_ID, ts, f"{amt:.2f}", direction, ch,
+            MERCHANT_ID, ts, amt, direction, ch,
             cat, note, tok,
             role, purpose, cct,
             record_status, failure_reason, partial_record
         ])
 
     # 1) Generic retail receipts
-    times = sample_times(credit_n)
-    amts = gen_credit_amounts(credit_n, fraud_like=fraud_like)
-    retail_channels = pick_channel_for_retail(credit_n, fraud_like=fraud_like)
-
-    for t, amt, ch in zip(times, amts, retail_channels):
-        direction = "credit"
-        r = random.random()
-
-        # Retail sale -> FREE
-        if r < 0.84:
-            role, purpose, cct = "customer", "sale", "FREE"
-            cat, note = random.choice(CUSTOMER_TAGS), "Purchase"
-            cp = sample_customer_token()
-
-        # Platform settlement -> PASS_THROUGH (includes WALLET + COD_SETTLEMENT)
-        elif r < 0.92:
-            role, purpose, cct = "platform", "settlement", "PASS_THROUGH"
-            cp = sample_platform_token()
-            cat, note = "Settlement", "Settlement"
-            amt = round(amt * np.random.uniform(2.2, 4.0), 2)
-
-            sr = random.random()
-            if sr < 0.55:
-                ch = CHANNEL_BANK
-                note = "Settlement (bank)"
-            elif sr < 0.80:
-                ch = CHANNEL_WALLET
-                note = "Settlement (wallet)"
-            else:
-                ch = CHANNEL_COD_SETTLEMENT
-                note = "COD settlement"
-
-        # Owner infusion -> ARTIFICIAL
-        elif r < 0.985:
-            role, purpose, cct = "owner", "owner_transfer", "ARTIFICIAL"
-            cat, note = random.choice(TRANSFER_TAGS), "Transfer"
-            cp = OWNER
-            ch = CHANNEL_BANK if random.random() < 0.7 else CHANNEL_UPI
-            amt = round(float(np.random.lognormal(mean=math.log(45000), sigma=0.35)), 2)
-
-        # Conditional reimbursements -> CONDITIONAL
-        else:
-            role, purpose, cct = "platform", "reimbursement", "CONDITIONAL"
-            cat, note = random.choice(CONDITIONAL_TAGS), "Reimbursement"
-            cp = "cp_conditional_001"
-            ch = CHANNEL_BANK
-            amt = round(float(np.random.lognormal(mean=math.log(6000), sigma=0.30)), 2)
-
-        record_status, failure_reason, partial_record, amt_out, cp_out = maybe_inject_failure(
-            amount=float(amt),
-            direction=direction,
-            channel=ch,
-            raw_counterparty_token=cp,
-        )
-        amt = amt_out
-        cp = cp_out
-
-        if partial_record == 1:
-            if random.random() < 0.7:
-                note = ""
-            if random.random() < 0.4:
-                cat = ""
-
-        ts = iso_ts(d, t, TZ_OFFSET)
-        rows.append([
-            MERCHANT_ID, ts, f"{amt:.2f}", direction, ch,
-            cat, note, cp,
-            role, purpose, cct,
-            record_status, failure_reason, partial_record
-        ])
+    rows.extend(generate_retail_rows(day, credit_n, fraud_like, rng, py_rng))
 
     # 2) Debits: supplier + ops + fees + owner withdraw + refunds
     debits: List[Tuple[str, float, str, str, str, str, str, str]] = []
     # tuple: (channel, amt, cat, note, cp, role, purpose, cct)
+    # At most two supplier, two platform and one customer debit per day.
+    debit_suppliers = TOKENS.sample_suppliers(2, rng)
+    debit_platforms = TOKENS.sample_platforms(2, rng)
+    (refund_customer,) = TOKENS.sample_customers(1, rng)
 
     # Weekly inventory purchase (Tue): NET_BANKING bias
     if d.weekday() == 1:
-        amt = round(float(np.random.lognormal(mean=math.log(38000), sigma=0.25)), 2)
-        ch = CHANNEL_NET_BANKING if random.random() < 0.65 else CHANNEL_BANK
-        debits.append((ch, amt, random.choice(SUPPLIER_TAGS), "Inventory purchase",
-                       sample_supplier_token(), "supplier", "inventory", "CONSTRAINED"))
+        amt = round(float(rng.lognormal(mean=LN_38000, sigma=0.25)), 2)
+        ch = CHANNEL_NET_BANKING if py_rng.random() < 0.65 else CHANNEL_BANK
+        debits.append((ch, amt, py_rng.choice(SUPPLIER_TAGS), "Inventory purchase",
+                       debit_suppliers[0], "supplier", "inventory", "CONSTRAINED"))
 
     # Monthly rent (5th): BANK
     if d.day == 5:
-        amt = round(float(np.random.lognormal(mean=math.log(28000), sigma=0.20)), 2)
+        amt = round(float(rng.lognormal(mean=LN_28000, sigma=0.20)), 2)
         debits.append((CHANNEL_BANK, amt, "Rent", "Shop rent",
-                       sample_utility_token("rent"), "utility", "operating_expense", "CONSTRAINED"))
+                       sample_utility_token("rent", py_rng), "utility", "operating_expense", "CONSTRAINED"))
 
     # Utilities (10th, 20th)
     if d.day in (10, 20):
-        amt = round(float(np.random.lognormal(mean=math.log(6500), sigma=0.18)), 2)
-        util_kind = "electricity" if random.random() < 0.6 else "telecom"
+        amt = round(float(rng.lognormal(mean=LN_6500, sigma=0.18)), 2)
+        util_kind = "electricity" if py_rng.random() < 0.6 else "telecom"
         debits.append((CHANNEL_BANK, amt, "Utilities", "Bills",
-                       sample_utility_token(util_kind), "utility", "operating_expense", "CONSTRAINED"))
+                       sample_utility_token(util_kind, py_rng), "utility", "operating_expense", "CONSTRAINED"))
 
     # Platform fees: BANK/WALLET/CARD mix (PASS_THROUGH)
-    if random.random() < 0.30:
-        amt = round(float(np.random.uniform(15, 250)), 2)
-        ch = str(np.random.choice([CHANNEL_BANK, CHANNEL_WALLET, CHANNEL_CARD], p=[0.55, 0.25, 0.20]))
+    if py_rng.random() < 0.30:
+        amt = round(float(rng.uniform(15, 250)), 2)
+        ch = str(rng.choice(_FEE_CHANNELS, p=_FEE_P))
         debits.append((ch, amt, "Fee", "Charges",
-                       sample_platform_token(), "platform", "fee", "PASS_THROUGH"))
+                       debit_platforms[0], "platform", "fee", "PASS_THROUGH"))
 
     # Owner withdraw: UPI/WALLET (ARTIFICIAL)
-    if random.random() < (0.08 if scenario != "stress" else 0.05):
-        amt = round(float(np.random.lognormal(mean=math.log(4000), sigma=0.35)), 2)
-        ch = CHANNEL_UPI if random.random() < 0.75 else CHANNEL_WALLET
+    if py_rng.random() < (0.08 if scenario != "stress" else 0.05):
+        amt = round(float(rng.lognormal(mean=LN_4000, sigma=0.35)), 2)
+        ch = CHANNEL_UPI if py_rng.random() < 0.75 else CHANNEL_WALLET
         debits.append((ch, amt, "Money Transfer", "Owner withdraw",
                        OWNER, "owner", "owner_transfer", "ARTIFICIAL"))
 
     # Refunds: UPI/WALLET (PASS_THROUGH)
-    if random.random() < 0.01:
-        amt = round(float(np.random.lognormal(mean=math.log(500), sigma=0.45)), 2)
-        ch = CHANNEL_UPI if random.random() < 0.7 else CHANNEL_WALLET
+    if py_rng.random() < 0.01:
+        amt = round(float(rng.lognormal(mean=LN_500, sigma=0.45)), 2)
+        ch = CHANNEL_UPI if py_rng.random() < 0.7 else CHANNEL_WALLET
         debits.append((ch, amt, "Refund", "Refund",
-                       sample_customer_token(), "customer", "refund", "PASS_THROUGH"))
+                       refund_customer, "customer", "refund", "PASS_THROUGH"))
 
     # Stress: emergency stock purchase (CONSTRAINED) NET_BANKING/BANK
-    if scenario == "stress" and random.random() < 0.35:
-        amt = round(float(np.random.lognormal(mean=math.log(12000), sigma=0.25)), 2)
-        ch = CHANNEL_NET_BANKING if random.random() < 0.55 else CHANNEL_BANK
-        debits.append((ch, amt, random.choice(SUPPLIER_TAGS), "Emergency stock",
-                       sample_supplier_token(), "supplier", "inventory", "CONSTRAINED"))
+    if scenario == "stress" and py_rng.random() < 0.35:
+        amt = round(float(rng.lognormal(mean=LN_12000, sigma=0.25)), 2)
+        ch = CHANNEL_NET_BANKING if py_rng.random() < 0.55 else CHANNEL_BANK
+        debits.append((ch, amt, py_rng.choice(SUPPLIER_TAGS), "Emergency stock",
+                       debit_suppliers[1], "supplier", "inventory", "CONSTRAINED"))
 
     # Fraud-like: extra chargeback/fee (PASS_THROUGH) CARD
-    if scenario == "fraud_like" and random.random() < 0.40:
-        amt = round(float(np.random.uniform(200, 1200)), 2)
+    if scenario == "fraud_like" and py_rng.random() < 0.40:
+        amt = round(float(rng.uniform(200, 1200)), 2)
         debits.append((CHANNEL_CARD, amt, "Fee", "Chargeback fee",
-                       sample_platform_token(), "platform", "fee", "PASS_THROUGH"))
+                       debit_platforms[1], "platform", "fee", "PASS_THROUGH"))
 
     # Render debit rows with failure injection + partial record simulation
-    for ch, amt, cat, note, cp, role, purpose, cct in debits:
+    draws, clean = failure_draws(len(debits), rng)
+    # Early morning or late night, any minute and second of the hour
+    debit_hours = rng.choice(np.array([8, 9, 22, 23]), size=len(debits))
+    debit_ts = iso_timestamps(day, debit_hours * 3600 + rng.integers(0, 3600, size=len(debits)))
+    for i, ((ch, amt, cat, note, cp, role, purpose, cct), ts) in enumerate(zip(debits, debit_ts)):
         direction = "debit"
-        t = time(random.choice([8, 9, 22, 23]), random.randint(0, 59), random.randint(0, 59))
 
-        record_status, failure_reason, partial_record, amt_out, cp_out = maybe_inject_failure(
-            amount=float(amt),
-            direction=direction,
-            channel=ch,
-            raw_counterparty_token=cp,
-        )
-        amt = amt_out
-        cp = cp_out
+        if clean[i]:
+            record_status, failure_reason, partial_record = RECORD_STATUS_SUCCESS, "", 0
+        else:
+            record_status, failure_reason, partial_record, amt, cp = maybe_inject_failure(
+                amount=float(amt),
+                direction=direction,
+                channel=ch,
+                raw_counterparty_token=cp,
+                rands=draws[i],
+            )
 
         if partial_record == 1:
-            if random.random() < 0.7:
+            if py_rng.random() < 0.7:
                 note = ""
-            if random.random() < 0.4:
+            if py_rng.random() < 0.4:
                 cat = ""
 
-        ts = iso_ts(d, t, TZ_OFFSET)
         rows.append([
-            MERCHANT_ID, ts, f"{amt:.2f}", direction, ch,
+            MERCHANT_ID, ts, amt, direction, ch,
             cat, note, cp,
             role, purpose, cct,
             record_status, failure_reason, partial_record
         ])
 
+    # Amounts stay floats while rows are built; format the column in one call.
+    amount_strs = np.char.mod("%.2f", np.array([row[2] for row in rows], dtype=np.float64))
+    for row, amount_str in zip(rows, amount_strs.tolist()):
+        row[2] = amount_str
     return rows
 
 
-def generate_dataset(
+def generate_rows(
     scenario: str,
     start_date: datetime,
     days: int,
-) -> pd.DataFrame:
-    refill_state = init_chronic_refill_state(start_date, CHRONIC)
+    seed: int = DEFAULT_SEED,
+) -> List[List[str]]:
+    """
+    Paytm-like rows for the whole period, in timestamp order.
+    ts is ISO-8601 with one fixed offset, so the strings sort chronologically
+    and no datetime parse is needed. Days are generated in order and every
+    row's ts falls on its own day, so sorting each day's rows is enough.
+
+    Chronic refill state carries across days, so it has its own stream and
+    is stepped here; each day then draws from its own spawned streams and
+    could be generated independently of the others.
+    """
+    refill_seq, *day_seqs = scenario_seed(seed, scenario).spawn(days + 1)
+    refill_rng = np.random.default_rng(refill_seq)
+    refill_state = init_chronic_refill_state(start_date, CHRONIC, refill_rng)
 
     all_rows: List[List[str]] = []
-    for i in range(days):
+    for i, day_seq in enumerate(day_seqs):
         d = start_date + timedelta(days=i)
-        all_rows.extend(generate_day(d, scenario=scenario, refill_state=refill_state))
+        refill_purchases = emit_chronic_refills_for_day(d, scenario, refill_state, refill_rng)
+        rng, py_rng = day_rngs(day_seq)
+        day_rows = generate_day(d, scenario, refill_purchases, rng, py_rng)
+        day_rows.sort(key=itemgetter(1))
+        all_rows.extend(day_rows)
+    return all_rows
+
+
+def _open_binary(path: str) -> io.BufferedIOBase:
+    # Level 1 keeps most of gzip's size win at a fraction of the default's CPU;
+    # a fixed mtime makes reruns byte-identical.
+    if path.endswith(".gz"):
+        return gzip.GzipFile(path, mode="wb", compresslevel=1, mtime=0)
+    return open(path, "wb", buffering=1 << 20)
 
-    df = pd.DataFrame(all_rows, columns=PAYTM_LIKE_COLUMNS)
-    # sort stable
-    df["ts_sort"] = pd.to_datetime(df["ts"].str.replace(TZ_OFFSET, ""), errors="coerce")
-    df = df.sort_values("ts_sort").drop(columns=["ts_sort"]).reset_index(drop=True)
-    return df
 
+def rows_table(header: List[str], rows: List[List[str]]) -> pa.Table:
+    # amount is already "%.2f" text; the int partial_record flag is stored as int8.
+    columns = zip(*rows) if rows else [()] * len(header)
+    return pa.table({
+        name: pa.array(col, pa.int8() if name == "partial_record" else None)
+        for name, col in zip(header, columns)
+    })
 
-def minimal_export(df: pd.DataFrame) -> pd.DataFrame:
-    return df[MINIMAL_COLUMNS].copy()
 
+def write_csv(path: str, table: pa.Table) -> None:
+    """
+    Same layout as DataFrame.to_csv(index=False): minimal quoting, "\n" line ends.
+    A path ending in .gz is gzip-compressed.
+
+    Written by Arrow's C++ writer. Arrow always quotes the header, so that
+    line is written here, and its "none" quoting style refuses values
+    needing quotes; those files fall back to csv.writer.
+    """
+    options = pacsv.WriteOptions(include_header=False, quoting_style="none")
+    with _open_binary(path) as f:
+        f.write((",".join(table.column_names) + "\n").encode("utf-8"))
+        try:
+            pacsv.write_csv(table, f, options)
+            return
+        except pa.ArrowInvalid:
+            pass
+
+    with _open_binary(path) as raw, io.TextIOWrapper(raw, encoding="utf-8", newline="") as f:
+        w = csv.writer(f, lineterminator="\n")
+        w.writerow(table.column_names)
+        w.writerows(zip(*(col.to_pylist() for col in table.columns)))
+
+
+# Low-cardinality columns stored dictionary-encoded in Parquet
+PARQUET_DICTIONARY_COLUMNS = [
+    "merchant_id", "direction", "channel", "raw_category", "role_hint",
+    "purpose_hint", "cct_hint", "record_status", "failure_reason",
+]
 
-def write_outputs(out_dir: str, start_date: datetime, days: int, seed: int) -> None:
-    set_seeds(seed)
 
-    for scenario in SCENARIOS:
-        df = generate_dataset(scenario=scenario, start_date=start_date, days=days)
+def write_parquet(path: str, table: pa.Table) -> None:
+    """
+    Columnar copy of a CSV table: amount as float64 rather than "%.2f"
+    text, zstd level 1, dictionary encoding for the low-cardinality columns.
+    """
+    i = table.schema.get_field_index("amount")
+    table = table.set_column(i, "amount", pc.cast(table["amount"], pa.float64()))
+    use_dictionary = [c for c in PARQUET_DICTIONARY_COLUMNS if c in table.column_names]
+    pq.write_table(table, path, compression="zstd", compression_level=1, use_dictionary=use_dictionary)
 
-        paytm_like_path = f"{out_dir}/pharmacy_paytm_like_{scenario}_v5.csv"
-        minimal_path = f"{out_dir}/pharmacy_minimal_{scenario}_v5.csv"
 
-        df.to_csv(paytm_like_path, index=False)
-        minimal_export(df).to_csv(minimal_path, index=False)
+def write_scenario(
+    out_dir: str,
+    scenario: str,
+    start_date: datetime,
+    days: int,
+    seed: int,
+    compress: bool = False,
+    fmt: str = "csv",
+) -> None:
+    """
+    Generate and write one scenario's Paytm-like and minimal files, as
+    CSV, Parquet or both (`fmt`).
+    Seeded from `seed` and the scenario (see scenario_seed), so the output
+    does not depend on which process runs it or in what order.
+    """
+    rows = generate_rows(scenario=scenario, start_date=start_date, days=days, seed=seed)
+
+    paytm_like_path = f"{out_dir}/pharmacy_paytm_like_{scenario}_v5"
+    minimal_path = f"{out_dir}/pharmacy_minimal_{scenario}_v5"
+
+    # The minimal export is a column selection of the same table, not a re-projection of rows.
+    table = rows_table(PAYTM_LIKE_COLUMNS, rows)
+    minimal = table.select(MINIMAL_COLUMNS)
+    if fmt in ("csv", "both"):
+        ext = ".csv.gz" if compress else ".csv"
+        write_csv(paytm_like_path + ext, table)
+        write_csv(minimal_path + ext, minimal)
+    if fmt in ("parquet", "both"):
+        write_parquet(paytm_like_path + ".parquet", table)
+        write_parquet(minimal_path + ".parquet", minimal)
+
+
+def write_outputs(
+    out_dir: str,
+    start_date: datetime,
+    days: int,
+    seed: int,
+    compress: bool = False,
+    jobs: int = 1,
+    fmt: str = "csv",
+) -> None:
+    # Scenarios share no state; with jobs > 1 each runs in its own process.
+    args = [(out_dir, scenario, start_date, days, seed, compress, fmt) for scenario in SCENARIOS]
+    if jobs <= 1:
+        for a in args:
+            write_scenario(*a)
+        return
+
+    with ProcessPoolExecutor(max_workers=min(jobs, len(SCENARIOS))) as pool:
+        for future in [pool.submit(write_scenario, *a) for a in args]:
+            future.result()
 
 
 # -----------------------------
@@ -646,13 +921,24 @@ def build_arg_parser() -> argparse.ArgumentParser:
     p.add_argument("--start_date", type=str, default=DEFAULT_START_DATE, help="YYYY-MM-DD")
     p.add_argument("--days", type=int, default=DEFAULT_DAYS, help="Number of days to generate.")
     p.add_argument("--seed", type=int, default=DEFAULT_SEED, help="Random seed.")
+    p.add_argument("--gzip", action="store_true", help="Write gzip-compressed .csv.gz files.")
+    p.add_argument("--jobs", type=int, default=1, help="Scenarios generated in parallel (1 = serial).")
+    p.add_argument("--format", choices=["csv", "parquet", "both"], default="csv", help="Output file format.")
     return p
 
 
 def main() -> None:
     args = build_arg_parser().parse_args()
     start_date = parse_date(args.start_date)
-    write_outputs(out_dir=args.out_dir, start_date=start_date, days=args.days, seed=args.seed)
+    write_outputs(
+        out_dir=args.out_dir,
+        start_date=start_date,
+        days=args.days,
+        seed=args.seed,
+        compress=args.gzip,
+        jobs=args.jobs,
+        fmt=args.format,
+    )
 
 
 if __name__ == "__main__":
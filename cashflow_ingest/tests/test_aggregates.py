@@ -1,4 +1,6 @@
-from datetime import datetime, timezone
+from datetime import date, datetime, timedelta, timezone
+
+import pandas as pd
 
 from cashflow_ingest.ingest.pipeline.aggregates import compute_daily_inflow_outflow
 from cashflow_ingest.api.schemas import CanonicalTxn, Channel, Direction
@@ -27,3 +29,42 @@ def test_daily_aggregates():
     daily = compute_daily_inflow_outflow(events)
     assert daily[t1.date()] == (100.0, 50.0)
     assert daily[t3.date()] == (20.0, 0.0)
+
+
+def test_daily_aggregates_bucket_by_local_offset():
+    ist = timezone(timedelta(hours=5, minutes=30))
+    # 00:30 IST on Jan 2 is still Jan 1 in UTC; bucket by the event's own offset.
+    t1 = datetime(2025, 1, 2, 0, 30, tzinfo=ist)
+    t2 = datetime(2025, 1, 1, 23, 30, tzinfo=ist)
+    daily = compute_daily_inflow_outflow([
+        _evt(t1, 10.0, Direction.credit),
+        _evt(t2, 5.0, Direction.debit),
+    ])
+    assert daily == {date(2025, 1, 2): (10.0, 0.0), date(2025, 1, 1): (0.0, 5.0)}
+
+
+def test_daily_aggregates_mixed_offsets():
+    ist = timezone(timedelta(hours=5, minutes=30))
+    t1 = datetime(2025, 1, 2, 0, 30, tzinfo=ist)
+    t2 = datetime(2025, 1, 1, 20, 0, tzinfo=timezone.utc)
+    daily = compute_daily_inflow_outflow([
+        _evt(t1, 10.0, Direction.credit),
+        _evt(t2, 5.0, Direction.credit),
+    ])
+    assert daily == {date(2025, 1, 2): (10.0, 0.0), date(2025, 1, 1): (5.0, 0.0)}
+
+
+def test_daily_aggregates_from_frame():
+    frame = pd.DataFrame(
+        {
+            "event_ts": pd.to_datetime(
+                ["2025-01-02T00:30:00+05:30", "2025-01-01T23:30:00+05:30", "2025-01-02T10:00:00+05:30"],
+                format="ISO8601",
+            ),
+            "amount": [10.0, 5.0, 2.5],
+            "direction": ["credit", "debit", "debit"],
+        }
+    )
+    daily = compute_daily_inflow_outflow(frame)
+    assert daily == {date(2025, 1, 2): (10.0, 2.5), date(2025, 1, 1): (0.0, 5.0)}
+    assert compute_daily_inflow_outflow(frame.iloc[0:0]) == {}
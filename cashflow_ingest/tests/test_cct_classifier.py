@@ -1,22 +1,28 @@
 import os
 
-from cashflow_ingest.ingest.pipeline.cct_classifier import classify_cct
+from cashflow_ingest.ingest.pipeline.cct_classifier import CCTSettings, classify_cct, classify_cct_batch, cct_settings
 from cashflow_ingest.ingest.pipeline.cct_enums import CCT
 from cashflow_ingest.ingest.pipeline.semantic_classifier import TxnSemantic
 
 
-def _sem(raw_narration: str | None) -> TxnSemantic:
+def _sem(
+    raw_narration: str | None,
+    raw_category: str | None = None,
+    direction: str = "credit",
+    channel: str = "UPI",
+    purpose_class: str = "UNKNOWN",
+) -> TxnSemantic:
     return TxnSemantic(
         subject_ref="s1",
         event_ts=None,
-        direction="credit",
+        direction=direction,
         amount=100.0,
-        channel="UPI",
-        raw_category=None,
+        channel=channel,
+        raw_category=raw_category,
         raw_narration=raw_narration,
         raw_counterparty_token=None,
         role_class="UNKNOWN",
-        purpose_class="UNKNOWN",
+        purpose_class=purpose_class,
     )
 
 
@@ -36,3 +42,53 @@ def test_threshold_forces_unknown(monkeypatch):
     sem = _sem("sale")
     res = classify_cct(sem)
     assert res.cct == CCT.UNKNOWN
+
+
+def test_threshold_overrides_json(monkeypatch):
+    monkeypatch.delenv("MIN_CCT_CONFIDENCE", raising=False)
+    monkeypatch.setenv("CCT_THRESHOLDS_JSON", '{"free": 0.95}')
+    assert classify_cct(_sem("sale")).cct == CCT.UNKNOWN
+
+    monkeypatch.setenv("CCT_THRESHOLDS_JSON", "not json")
+    assert classify_cct(_sem("sale")).cct == CCT.FREE
+
+
+def test_batch_matches_scalar(monkeypatch):
+    monkeypatch.delenv("AMBIGUITY_DELTA", raising=False)
+    monkeypatch.delenv("MIN_CCT_CONFIDENCE", raising=False)
+    monkeypatch.delenv("CCT_THRESHOLDS_JSON", raising=False)
+    # (narration, category, direction, channel, purpose_class as classify_role_purpose would set it)
+    rows = [
+        ("settlement owner transfer", None, "credit", "UPI", "OWNER_TRANSFER"),
+        ("sale", None, "credit", "UPI", "SALE"),
+        (None, " Rent ", "debit", "BANK", "OPEX_OR_STATUTORY"),
+        ("PROMO cashback", None, "debit", "CARD", "UNKNOWN"),
+        (None, None, "debit", "CARD", "UNKNOWN"),
+        ("refund", "pos", "credit", "WALLET", "REFUND_OR_REVERSAL"),
+    ]
+    expected = [classify_cct(_sem(*row)) for row in rows]
+    narrations, categories, directions, channels, _ = zip(*rows)
+    assert classify_cct_batch(categories, narrations, directions, channels) == expected
+    assert expected[0].cct == CCT.UNKNOWN
+    assert expected[4].rules_fired == ["PURPOSE_UNKNOWN"]
+
+
+def test_explicit_settings_skip_environment(monkeypatch):
+    monkeypatch.setenv("MIN_CCT_CONFIDENCE", "0.95")
+    assert cct_settings().min_conf == 0.95
+
+    relaxed = CCTSettings(min_conf=0.70, ambiguity_delta=0.05, overrides={})
+    assert classify_cct(_sem("sale"), relaxed).cct == CCT.FREE
+    assert classify_cct_batch([None], ["sale"], ["credit"], ["UPI"], relaxed)[0].cct == CCT.FREE
+
+
+def test_batch_classifies_repeated_rows_once():
+    categories = [None, "Stock", None, "Stock", None]
+    narrations = ["sale", None, "sale", None, "sale"]
+    directions = ["credit", "debit", "credit", "debit", "debit"]
+    channels = ["UPI", "NET_BANKING", "UPI", "NET_BANKING", "UPI"]
+    results = classify_cct_batch(categories, narrations, directions, channels)
+    assert [r.cct for r in results] == [CCT.FREE, CCT.CONSTRAINED, CCT.FREE, CCT.CONSTRAINED, CCT.FREE]
+    assert results[0] is results[2] and results[1] is results[3]
+    assert results[4] is not results[0]
+    assert classify_cct_batch([], [], [], []) == []
@@ -1,3 +1,5 @@
+import io
+
 import pandas as pd
 
 from cashflow_ingest.ingest.adapters.csv_file import (
@@ -39,3 +41,93 @@ def test_read_csv_bytes_with_extras_keeps_all_columns():
     assert "record_status" in df.columns
     assert "partial_record" in df.columns
     assert isinstance(df, pd.DataFrame)
+
+
+def test_read_csv_bytes_with_extras_accepts_file_object():
+    csv = _csv_bytes(
+        "merchant_id,ts,amount,direction,channel,record_status\n"
+        "m1,2025-01-01T00:00:00+05:30,10,credit,UPI,SUCCESS\n"
+    )
+    df = read_csv_bytes_with_extras(io.BytesIO(csv))
+    assert df.loc[0, "record_status"] == "SUCCESS"
+
+
+def test_read_csv_bytes_keeps_raw_text():
+    csv = _csv_bytes(
+        "merchant_id,ts,amount,direction,channel\n"
+        "007,2025-01-01T00:00:00+05:30,10,credit,UPI\n"
+    )
+    df = read_csv_bytes(csv)
+    assert df.loc[0, "merchant_id"] == "007"
+    assert df.loc[0, "ts"] == "2025-01-01T00:00:00+05:30"
+
+
+def test_read_csv_bytes_enforces_max_rows():
+    csv = _csv_bytes(
+        "merchant_id,ts,amount,direction,channel\n"
+        "m1,2025-01-01T00:00:00+05:30,10,credit,UPI\n"
+        "m1,2025-01-01T01:00:00+05:30,20,credit,UPI\n"
+    )
+    try:
+        read_csv_bytes_with_extras(csv, max_rows=1)
+        assert False, "expected too many rows error"
+    except ValueError as e:
+        assert "too many rows: 2 > 1" in str(e)
+
+
+def test_read_csv_bytes_with_extras_projects_columns():
+    csv = _csv_bytes(
+        "merchant_id,ts,amount,direction,channel,record_status,raw_note\n"
+        "m1,2025-01-01T00:00:00+05:30,10,credit,UPI,SUCCESS,hello\n"
+    )
+    df = read_csv_bytes_with_extras(csv, columns={"record_status", "partial_record"})
+    # Requested-but-absent columns are not invented; unrequested extras are not parsed.
+    assert set(df.columns) == REQUIRED_COLUMNS | {"record_status"}
+
+
+def test_read_csv_bytes_pandas_na_strings_are_missing():
+    csv = _csv_bytes(
+        "merchant_id,ts,amount,direction,channel\n"
+        "None,2025-01-01T00:00:00+05:30,10,credit,UPI\n"
+        "NA,2025-01-01T00:00:00+05:30,10,credit,UPI\n"
+        "N/A,2025-01-01T00:00:00+05:30,10,credit,UPI\n"
+        "<NA>,2025-01-01T00:00:00+05:30,10,credit,UPI\n"
+        "m1,2025-01-01T00:00:00+05:30,10,credit,UPI\n"
+    )
+    df = read_csv_bytes(csv)
+    assert df["merchant_id"].isna().tolist() == [True, True, True, True, False]
+
+
+def test_read_csv_bytes_keeps_multiline_quoted_values():
+    narration = "line one\nline two"
+    rows = "".join(
+        f'm{i},2025-01-01T00:00:00+05:30,10,credit,UPI,"{narration} {i}"\n' for i in range(20_000)
+    )
+    csv = _csv_bytes("merchant_id,ts,amount,direction,channel,raw_narration\n" + rows)
+    df = read_csv_bytes_with_extras(csv)
+    assert len(df) == 20_000
+    assert df["raw_narration"].tolist() == [f"{narration} {i}" for i in range(20_000)]
+
+
+def test_read_csv_bytes_pads_short_rows():
+    csv = _csv_bytes(
+        "merchant_id,ts,amount,direction,channel,record_status\n"
+        "m1,2025-01-01T00:00:00+05:30,10,credit,UPI,SUCCESS\n"
+        "m2,2025-01-01T01:00:00+05:30,20,credit\n"
+        "m3,2025-01-01T02:00:00+05:30,30,debit,UPI,SUCCESS\n"
+    )
+    df = read_csv_bytes_with_extras(csv, columns={"record_status"})
+    assert df["merchant_id"].tolist() == ["m1", "m2", "m3"]
+    assert df["channel"].isna().tolist() == [False, True, False]
+    assert df["record_status"].isna().tolist() == [False, True, False]
+
+
+def test_read_csv_bytes_renames_duplicate_headers():
+    csv = _csv_bytes(
+        "merchant_id,ts,amount,direction,channel,note,note\n"
+        "m1,2025-01-01T00:00:00+05:30,10,credit,UPI,first,second\n"
+    )
+    df = read_csv_bytes_with_extras(csv, columns={"note", "note.1"})
+    assert df.loc[0, "note"] == "first"
+    assert df.loc[0, "note.1"] == "second"
+    assert read_csv_bytes(csv).loc[0, "merchant_id"] == "m1"
@@ -0,0 +1,72 @@
+from datetime import datetime, timezone
+
+import pandas as pd
+
+from cashflow_ingest.api.schemas import CanonicalTxn, Channel, Direction
+from cashflow_ingest.ingest.pipeline.aggregates import compute_daily_inflow_outflow
+from cashflow_ingest.ingest.pipeline.cct_aggregates import aggregate_daily_control
+from cashflow_ingest.ingest.pipeline.event_scan import scan_events
+from cashflow_ingest.ingest.pipeline.normalizer import events_from_frame, normalize_df
+
+
+def _evt(ts: datetime, amount: float, direction: Direction, payer_token: str | None = None) -> CanonicalTxn:
+    return CanonicalTxn(
+        subject_ref="s1",
+        merchant_id="m1",
+        event_ts=ts,
+        amount=amount,
+        direction=direction,
+        channel=Channel.UPI,
+        raw_category="sale",
+        raw_counterparty_token=payer_token,
+    )
+
+
+def test_scan_matches_individual_passes():
+    t1 = datetime(2025, 1, 2, 10, 0, tzinfo=timezone.utc)
+    t2 = datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+    t3 = datetime(2025, 1, 3, 9, 0, tzinfo=timezone.utc)
+    events = [
+        _evt(t1, 100.0, Direction.credit),
+        _evt(t2, 50.0, Direction.debit, payer_token="p1"),
+        _evt(t3, 20.0, Direction.credit),
+    ]
+    scan = scan_events(events)
+    assert scan.min_ts == t2
+    assert scan.max_ts == t3
+    assert scan.payer_token_present is True
+    assert scan.daily.as_dict() == compute_daily_inflow_outflow(events)
+    assert scan.daily_control == aggregate_daily_control(events)
+    unknown = sum(v["derived"]["unknown_cct_count"] for v in scan.daily_control.values())
+    assert scan.cct_unknown_rate == unknown / len(events)
+
+
+def test_scan_without_payer_tokens():
+    t1 = datetime(2025, 1, 1, 10, 0, tzinfo=timezone.utc)
+    scan = scan_events([_evt(t1, 10.0, Direction.credit)])
+    assert scan.payer_token_present is False
+    assert scan.min_ts == scan.max_ts == t1
+
+
+def test_scan_of_normalized_frame_matches_events():
+    df = pd.DataFrame(
+        {
+            "merchant_id": ["m1", "m1", "m1", "m1"],
+            "ts": [
+                "2025-01-02T10:00:00+05:30",
+                "2025-01-01T23:30:00+05:30",
+                "2025-01-02T01:00:00+05:30",
+                "bad",
+            ],
+            "amount": ["100", "50.5", "20", "1"],
+            "direction": ["credit", "debit", "credit", "credit"],
+            "channel": ["UPI", "NET_BANKING", "CARD", "UPI"],
+            "narration": ["pos sale", "rent", None, None],
+            "vpa": [None, "p1@upi", "p1@upi", None],
+            "partial_record": ["0", "1", "0", "0"],
+        },
+        dtype="str",
+    )
+    frame, _ = normalize_df(df)
+    events = events_from_frame(frame, subject_ref="s1")
+    assert scan_events(frame) == scan_events(events)
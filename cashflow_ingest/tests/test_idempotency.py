@@ -1,4 +1,7 @@
-from datetime import datetime, timezone
+import hashlib
+from datetime import date, datetime, timedelta, timezone
+
+import pandas as pd
 
 from cashflow_ingest.ingest.pipeline.idempotency import (
     compute_batch_idempotency_key,
@@ -28,6 +31,18 @@ def test_infer_min_max_ts():
     assert max_ts == t2
 
 
+def test_infer_min_max_ts_from_frame_and_mixed_offsets():
+    ist = timezone(timedelta(hours=5, minutes=30))
+    t1 = datetime(2025, 1, 1, 3, 0, tzinfo=ist)  # 2024-12-31T21:30Z
+    t2 = datetime(2025, 1, 1, 0, 0, tzinfo=timezone.utc)
+    t3 = datetime(2025, 1, 2, tzinfo=ist)
+
+    frame = pd.DataFrame({"event_ts": pd.DatetimeIndex([t3, t1])})
+    assert infer_min_max_ts(frame) == (t1, t3)
+    # Mixed offsets have no common datetime64 dtype; compared as instants
+    assert infer_min_max_ts([_evt(t2), _evt(t1), _evt(t3)]) == (t1, t3)
+
+
 def test_idempotency_key_stable():
     key1 = compute_batch_idempotency_key(
         subject_ref="s1",
@@ -66,3 +81,27 @@ def test_feed_idempotency_key_stable():
         payload_hash_hex="deadbeef",
     )
     assert key1 == key2
+
+
+def test_idempotency_key_format_is_stable():
+    # Keys are persisted; the hashed layout must not drift.
+    batch = compute_batch_idempotency_key(
+        subject_ref="s1",
+        source="PAYTM",
+        file_hash_hex="abc",
+        min_ts=datetime(2025, 1, 1, 23, 0),
+        max_ts=date(2025, 1, 2),
+    )
+    assert batch == hashlib.sha256(b"s1|PAYTM|abc|2025-01-01|2025-01-02").hexdigest()
+
+    feed = compute_feed_idempotency_key(
+        subject_ref="s1",
+        source="PAYTM",
+        watermark_ts=datetime(2025, 1, 2, 10, 0, tzinfo=timezone.utc),
+        min_ts=date(2025, 1, 1),
+        max_ts=date(2025, 1, 2),
+        event_count=3,
+        payload_hash_hex="deadbeef",
+    )
+    expected = b"s1|PAYTM|2025-01-02T10:00:00+00:00|2025-01-01|2025-01-02|3|deadbeef"
+    assert feed == hashlib.sha256(expected).hexdigest()
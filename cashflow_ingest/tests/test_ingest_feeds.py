@@ -141,6 +141,26 @@ def test_feed_invalid_rows_rejected_and_counted():
     assert body["rejection_breakdown"]["INVALID_AMOUNT"] == 1
 
 
+def test_feed_mixed_naive_and_offset_timestamps():
+    client = TestClient(app)
+    event = {"merchant_id": "m1", "amount": 10, "direction": "credit", "channel": "UPI"}
+    payload = {
+        "subject_ref": "m1",
+        "source": "PAYTM",
+        "watermark_ts": "2025-01-03T00:00:00+05:30",
+        "events": [
+            {**event, "ts": "2025-01-02T23:30:00+05:30"},
+            {**event, "ts": "2025-01-01T10:00:00"},
+            {**event, "ts": "2025-01-02T08:00:00+05:30"},
+        ],
+    }
+    resp = _post_feed(client, payload)
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["rows_accepted"] == 2
+    assert body["rejection_breakdown"] == {"INVALID_TS": 1}
+
+
 def test_feed_declared_range_validation():
     client = TestClient(app)
     payload = {
@@ -162,3 +182,122 @@ def test_feed_declared_range_validation():
     resp = _post_feed(client, payload)
     assert resp.status_code == 400
     assert resp.json()["detail"]["error"] == "inferred range outside declared range"
+
+
+def test_feed_duplicate_with_declared_range_skips_pipeline(monkeypatch):
+    from cashflow_ingest.api import routes_ingest
+
+    client = TestClient(app)
+    payload = {
+        "subject_ref": "m1",
+        "source": "PAYTM",
+        "watermark_ts": "2025-01-02T00:00:00+05:30",
+        "input_start_date": "2025-01-01",
+        "input_end_date": "2025-01-01",
+        "events": [
+            {
+                "merchant_id": "m1",
+                "ts": "2025-01-01T00:00:00+05:30",
+                "amount": 100,
+                "direction": "credit",
+                "channel": "UPI",
+            }
+        ],
+    }
+    first = _post_feed(client, payload)
+    assert first.status_code == 200
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("duplicate feed should not be normalized")
+
+    monkeypatch.setattr(routes_ingest, "normalize_df", _fail)
+    second = _post_feed(client, payload)
+    assert second.status_code == 409
+
+
+def test_feed_event_extras_ignored_and_required_fields_enforced():
+    client = TestClient(app)
+    event = {
+        "merchant_id": "m1",
+        "ts": "2025-01-01T00:00:00+05:30",
+        "amount": 10,
+        "direction": "credit",
+        "channel": "UPI",
+        "payer_token": "p1",
+        "customer_phone": "9999999999",
+    }
+    payload = {
+        "subject_ref": "m1",
+        "source": "PAYTM",
+        "watermark_ts": "2025-01-02T00:00:00+05:30",
+        "events": [event],
+    }
+    resp = _post_feed(client, payload)
+    assert resp.status_code == 200
+    assert resp.json()["payer_token_present"] is True
+
+    missing = {k: v for k, v in event.items() if k != "channel"}
+    resp = _post_feed(client, {**payload, "events": [missing]})
+    assert resp.status_code == 422
+
+
+def test_feed_replay_with_reordered_keys_is_duplicate():
+    client = TestClient(app)
+    event = {
+        "merchant_id": "m1",
+        "ts": "2025-01-01T00:00:00+05:30",
+        "amount": 100,
+        "direction": "credit",
+        "channel": "UPI",
+    }
+    payload = {
+        "subject_ref": "m1",
+        "source": "PAYTM",
+        "watermark_ts": "2025-01-02T00:00:00+05:30",
+        "events": [event],
+    }
+    assert _post_feed(client, payload).status_code == 200
+    reordered = dict(reversed(list(event.items())), debug_note="ignored")
+    resp = _post_feed(client, {**payload, "events": [reordered]})
+    assert resp.status_code == 409
+
+
+def test_feed_replay_with_null_instead_of_absent_field_is_duplicate():
+    client = TestClient(app)
+    event = {
+        "merchant_id": "m1",
+        "ts": "2025-01-01T00:00:00+05:30",
+        "amount": 100,
+        "direction": "credit",
+        "channel": "UPI",
+    }
+    payload = {
+        "subject_ref": "m1",
+        "source": "PAYTM",
+        "watermark_ts": "2025-01-02T00:00:00+05:30",
+        "events": [{**event, "raw_narration": None}],
+    }
+    assert _post_feed(client, payload).status_code == 200
+    resp = _post_feed(client, {**payload, "events": [event]})
+    assert resp.status_code == 409
+
+
+def test_feed_with_integer_beyond_64_bits_is_hashed():
+    client = TestClient(app)
+    event = {
+        "merchant_id": 2**70,
+        "ts": "2025-01-01T00:00:00+05:30",
+        "amount": 100,
+        "direction": "credit",
+        "channel": "UPI",
+    }
+    payload = {
+        "subject_ref": "m1",
+        "source": "PAYTM",
+        "watermark_ts": "2025-01-02T00:00:00+05:30",
+        "events": [event],
+    }
+    resp = _post_feed(client, payload)
+    assert resp.status_code == 200
+    assert resp.json()["rows_accepted"] == 1
+    assert _post_feed(client, payload).status_code == 409
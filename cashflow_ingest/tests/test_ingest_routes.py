@@ -1,6 +1,9 @@
+import hashlib
+
 from fastapi.testclient import TestClient
 
 from cashflow_ingest.api.app import app
+from cashflow_ingest.ingest.pipeline.memory_sink import InMemorySink
 
 
 def _csv_bytes(text: str) -> bytes:
@@ -28,6 +31,21 @@ def test_ingest_success_with_status_and_partial():
     assert body["rows_rejected"] == 1
     assert body["rejection_breakdown"] == {"FAILED_TIMEOUT": 1}
     assert body["accepted_partial_rows"] == 2
+    assert body["inferred_range"] == {
+        "min_ts": "2025-01-01T00:00:00+05:30",
+        "max_ts": "2025-01-01T02:00:00+05:30",
+    }
+
+
+def test_ingest_file_hash_is_sha256_of_upload():
+    client = TestClient(app)
+    csv = (
+        "merchant_id,ts,amount,direction,channel\n"
+        "m1,2025-01-01T00:00:00+05:30,100,credit,UPI\n"
+    )
+    resp = _post_csv(client, csv)
+    assert resp.status_code == 200
+    assert resp.json()["file_hash_sha256"] == hashlib.sha256(_csv_bytes(csv)).hexdigest()
 
 
 def test_ingest_unknown_status_bucketed():
@@ -45,6 +63,22 @@ def test_ingest_unknown_status_bucketed():
     assert body["rejection_breakdown"] == {"UNKNOWN_STATUS": 1}
 
 
+def test_ingest_status_normalized_before_bucketing():
+    client = TestClient(app)
+    csv = (
+        "merchant_id,ts,amount,direction,channel,record_status,partial_record\n"
+        "m1,2025-01-01T00:00:00+05:30,100,credit,UPI, success ,YES\n"
+        "m1,2025-01-01T01:00:00+05:30,50,credit,UPI,failed-timeout,\n"
+        "m1,2025-01-01T02:00:00+05:30,25,credit,UPI,,\n"
+    )
+    resp = _post_csv(client, csv)
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["rows_accepted"] == 1
+    assert body["rejection_breakdown"] == {"FAILED_TIMEOUT": 1, "UNKNOWN_STATUS": 1}
+    assert body["accepted_partial_rows"] == 1
+
+
 def test_ingest_invalid_rows_rejected_and_counted():
     client = TestClient(app)
     csv = (
@@ -62,6 +96,45 @@ def test_ingest_invalid_rows_rejected_and_counted():
     assert body["rejection_breakdown"]["INVALID_AMOUNT"] == 1
 
 
+def test_ingest_mixed_naive_and_offset_timestamps():
+    # The first row sets the timezone; a row that does not fit is INVALID_TS,
+    # not a failed request.
+    client = TestClient(app)
+    csv = (
+        "merchant_id,ts,amount,direction,channel\n"
+        "m1,2025-01-01T10:00:00,100,credit,UPI\n"
+        "m1,2025-01-02T23:30:00+05:30,50,credit,UPI\n"
+        "m1,2025-01-02T11:00:00,25,debit,UPI\n"
+    )
+    resp = _post_csv(client, csv)
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["rows_accepted"] == 2
+    assert body["rejection_breakdown"] == {"INVALID_TS": 1}
+    assert body["inferred_range"] == {"min_ts": "2025-01-01T10:00:00", "max_ts": "2025-01-02T11:00:00"}
+
+
+def test_ingest_mixed_offsets_keep_each_rows_offset():
+    client = TestClient(app)
+    csv = (
+        "merchant_id,ts,amount,direction,channel\n"
+        "m1,2025-01-01T23:30:00+05:30,100,credit,UPI\n"
+        "m1,2025-01-01T20:00:00+00:00,50,credit,UPI\n"
+        "m1,2025-01-02T01:00:00+05:30,25,debit,UPI\n"
+    )
+    resp = _post_csv(client, csv)
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["rows_accepted"] == 3
+    assert body["rejection_breakdown"] == {}
+    assert body["inferred_range"] == {
+        "min_ts": "2025-01-01T23:30:00+05:30",
+        "max_ts": "2025-01-01T20:00:00+00:00",
+    }
+    # Each row is bucketed by the calendar day in its own offset
+    assert body["daily_aggregate_days"] == 2
+
+
 def test_ingest_all_rows_invalid_returns_400():
     client = TestClient(app)
     csv = (
@@ -84,6 +157,13 @@ def test_ingest_empty_batch_returns_400():
     assert body["detail"]["error"] == "empty batch"
 
 
+def test_ingest_empty_file_returns_400():
+    client = TestClient(app)
+    resp = _post_csv(client, "")
+    assert resp.status_code == 400
+    assert resp.json()["detail"] == "empty file"
+
+
 def test_ingest_declared_range_validation():
     client = TestClient(app)
     csv = (
@@ -99,7 +179,13 @@ def test_ingest_declared_range_validation():
     }
     resp = client.post("/v1/ingest/files", data=data, files=files)
     assert resp.status_code == 400
-    assert resp.json()["detail"]["error"] == "inferred range outside declared range"
+    detail = resp.json()["detail"]
+    assert detail["error"] == "inferred range outside declared range"
+    assert detail["declared_range"] == {"input_start_date": "2025-01-01", "input_end_date": "2025-01-02"}
+    assert detail["inferred_range"] == {
+        "min_ts": "2025-01-05T00:00:00+05:30",
+        "max_ts": "2025-01-05T00:00:00+05:30",
+    }
 
 
 def test_min_accept_ratio_guard(monkeypatch):
@@ -128,3 +214,84 @@ def test_min_accept_ratio_disabled(monkeypatch):
     )
     resp = _post_csv(client, csv)
     assert resp.status_code == 200
+
+
+def test_ingest_duplicate_with_declared_range_skips_pipeline(monkeypatch):
+    from cashflow_ingest.api import routes_ingest
+
+    client = TestClient(app)
+    csv = (
+        "merchant_id,ts,amount,direction,channel\n"
+        "m1,2025-01-01T10:00:00+05:30,10,credit,UPI\n"
+    )
+    files = {"file": ("test.csv", _csv_bytes(csv), "text/csv")}
+    data = {
+        "subject_ref": "m1",
+        "source": "PAYTM",
+        "input_start_date": "2025-01-01",
+        "input_end_date": "2025-01-02",
+    }
+    first = client.post("/v1/ingest/files", data=data, files=files)
+    assert first.status_code == 200
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("duplicate upload should not be parsed")
+
+    monkeypatch.setattr(routes_ingest, "read_csv_bytes_with_extras", _fail)
+    second = client.post("/v1/ingest/files", data=data, files=files)
+    assert second.status_code == 409
+
+
+def test_ingest_malformed_declared_date_rejected_at_boundary():
+    client = TestClient(app)
+    csv = (
+        "merchant_id,ts,amount,direction,channel\n"
+        "m1,2025-01-01T10:00:00+05:30,10,credit,UPI\n"
+    )
+    files = {"file": ("test.csv", _csv_bytes(csv), "text/csv")}
+    data = {
+        "subject_ref": "m1",
+        "source": "PAYTM",
+        "input_start_date": "not-a-date",
+        "input_end_date": "2025-01-02",
+    }
+    resp = client.post("/v1/ingest/files", data=data, files=files)
+    assert resp.status_code == 422
+
+
+def test_ingest_retried_upload_rejected_before_parsing(monkeypatch):
+    from cashflow_ingest.api import routes_ingest
+
+    client = TestClient(app)
+    csv = (
+        "merchant_id,ts,amount,direction,channel\n"
+        "m1,2025-02-01T10:00:00+05:30,10,credit,UPI\n"
+    )
+    assert _post_csv(client, csv, subject_ref="retry").status_code == 200
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("retried upload should not be parsed")
+
+    with monkeypatch.context() as m:
+        m.setattr(routes_ingest, "read_csv_bytes_with_extras", _fail)
+        assert _post_csv(client, csv, subject_ref="retry").status_code == 409
+
+    # Storage stays authoritative: a remembered key alone never rejects.
+    app.state.storage = InMemorySink()
+    assert _post_csv(client, csv, subject_ref="retry").status_code == 200
+
+
+def test_upload_key_cache_follows_storage():
+    client = TestClient(app)
+    csv = (
+        "merchant_id,ts,amount,direction,channel\n"
+        "m1,2025-03-01T10:00:00+05:30,10,credit,UPI\n"
+    )
+    assert _post_csv(client, csv, subject_ref="fresh").status_code == 200
+    first_cache = app.state.upload_keys
+
+    # A fresh sink gets a fresh cache: the retried upload is parsed and accepted.
+    app.state.storage = InMemorySink()
+    assert _post_csv(client, csv, subject_ref="fresh").status_code == 200
+    assert app.state.upload_keys is not first_cache
+    assert app.state.upload_keys.storage is app.state.storage
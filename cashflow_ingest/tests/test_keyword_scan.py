@@ -0,0 +1,19 @@
+import pandas as pd
+
+from cashflow_ingest.ingest.pipeline.keyword_scan import KeywordScanner
+
+
+def test_scanner_matches_contains_any():
+    groups = [("settlement", "fee"), ("settle", "netting"), ("sale", "sales")]
+    scanner = KeywordScanner(groups)
+    texts = ["settlement batch", "netting", "wholesales fee", "", "nothing here"]
+    expected = [[any(k in t for k in g) for g in groups] for t in texts]
+
+    # "settlement" also fires the "settle" group even though only the longer word is reported
+    assert scanner.hits(pd.Series(texts, dtype=object)).tolist() == expected
+    assert [[bool(scanner.mask(t) >> i & 1) for i in range(len(groups))] for t in texts] == expected
+
+
+def test_scanner_empty_batch():
+    scanner = KeywordScanner([("a",)])
+    assert scanner.hits(pd.Series([], dtype=object)).shape == (0, 1)
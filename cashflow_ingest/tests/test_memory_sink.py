@@ -0,0 +1,84 @@
+from datetime import date
+
+import numpy as np
+import pytest
+
+from cashflow_ingest.ingest.pipeline.aggregates import DailyFlows
+from cashflow_ingest.ingest.pipeline.memory_sink import DuplicateBatchError, InMemorySink
+
+
+def test_daily_aggregates_roundtrip_per_subject():
+    sink = InMemorySink()
+    sink.persist_daily_aggregates(
+        subject_ref="s1",
+        daily_aggs={date(2025, 1, 1): (100.004, 50.0), date(2025, 1, 2): (0.0, 20.5)},
+    )
+    sink.persist_daily_aggregates(subject_ref="s2", daily_aggs={date(2025, 1, 1): (1.0, 2.0)})
+    sink.persist_daily_aggregates(subject_ref="s1", daily_aggs={date(2025, 1, 3): (7.0, 0.0)})
+
+    df = sink.daily_aggregates("s1")
+    assert df["day"].tolist() == [date(2025, 1, 1), date(2025, 1, 2), date(2025, 1, 3)]
+    assert df["inflow"].tolist() == [100.0, 0.0, 7.0]
+    assert df["outflow"].tolist() == [50.0, 20.5, 0.0]
+
+
+def test_daily_aggregates_unknown_subject_is_empty():
+    df = InMemorySink().daily_aggregates("missing")
+    assert df.empty
+    assert list(df.columns) == ["day", "inflow", "outflow"]
+
+
+@pytest.mark.filterwarnings("error")
+def test_daily_aggregates_round_like_builtin_round():
+    # Half-cent values are where a scaled np.round would disagree with round()
+    values = [2.675, 1.005, 0.125, 1e15 + 0.125, 123.456, float("inf")]
+    sink = InMemorySink()
+    sink.persist_daily_aggregates(
+        subject_ref="s1",
+        daily_aggs={date(2025, 1, i + 1): (v, -v) for i, v in enumerate(values)},
+    )
+    sink.persist_daily_aggregates(subject_ref="s1", daily_aggs={})
+
+    df = sink.daily_aggregates("s1")
+    assert df["inflow"].tolist() == [round(v, 2) for v in values]
+    assert df["outflow"].tolist() == [round(-v, 2) for v in values]
+
+
+def test_persist_batch_records_and_rejects_duplicates():
+    sink = InMemorySink()
+    kwargs = dict(
+        subject_ref="s1",
+        subject_ref_version=None,
+        source="PAYTM",
+        filename_hash="fh",
+        file_ext="csv",
+        file_hash_sha256="abc",
+        idempotency_key="k1",
+        rows_accepted=3,
+        rows_rejected=1,
+        range_start=date(2025, 1, 1),
+        range_end=date(2025, 1, 2),
+        cct_unknown_rate=1 / 3,
+    )
+    assert sink.persist_batch(**kwargs) == 1
+    assert sink.has_batch("k1")
+    record = sink._batches["k1"]
+    assert (record.batch_id, record.rows_accepted, record.cct_unknown_rate) == (1, 3, 0.333333)
+    with pytest.raises(DuplicateBatchError):
+        sink.persist_batch(**kwargs)
+
+
+def test_daily_aggregates_accept_daily_flow_arrays():
+    flows = DailyFlows(
+        days=np.array(["2025-01-01", "2025-01-02"], dtype="datetime64[D]"),
+        inflow=np.array([10.005, 0.0]),
+        outflow=np.array([1.0, 2.675]),
+    )
+    sink = InMemorySink()
+    sink.persist_daily_aggregates(subject_ref="s1", daily_aggs=flows)
+
+    df = sink.daily_aggregates("s1")
+    assert df["day"].tolist() == [date(2025, 1, 1), date(2025, 1, 2)]
+    assert df["inflow"].tolist() == [round(10.005, 2), 0.0]
+    assert df["outflow"].tolist() == [1.0, round(2.675, 2)]
+    assert DailyFlows.from_dict(flows.as_dict()) == flows
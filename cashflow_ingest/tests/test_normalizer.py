@@ -1,6 +1,13 @@
+from collections import Counter
+
 import pandas as pd
+import pytest
 
-from cashflow_ingest.ingest.pipeline.normalizer import normalize_df_to_events
+from cashflow_ingest.ingest.pipeline.normalizer import (
+    normalize_df,
+    normalize_df_to_events,
+    normalize_df_to_events_chunked,
+)
 
 
 def _df(rows: list[dict]) -> pd.DataFrame:
@@ -95,3 +102,236 @@ def test_normalizer_invalid_amount():
     assert len(events) == 0
     assert breakdown == {"INVALID_AMOUNT": 1}
     assert valid_indices == []
+
+
+def test_normalizer_accepts_column_mapping():
+    columns = {
+        "merchant_id": ["m1", "m1"],
+        "ts": ["2025-01-01T00:00:00+05:30", "not-a-date"],
+        "amount": [100, 10],
+        "direction": ["credit", "credit"],
+        "channel": ["UPI", "UPI"],
+    }
+    events, breakdown, valid_indices = normalize_df_to_events(columns, subject_ref="s1")
+    assert len(events) == 1
+    assert events[0].amount == 100.0
+    assert breakdown == {"INVALID_TS": 1}
+    assert valid_indices == [0]
+
+
+def test_normalize_df_returns_accepted_frame():
+    df = pd.DataFrame(
+        {
+            "merchant_id": ["m1", "", "m1"],
+            "ts": ["2025-01-01T00:00:00+05:30", "bad", "2025-01-02T00:00:00+05:30"],
+            "amount": ["100", "-1", "25.5"],
+            "direction": ["credit", "credit", " DEBIT "],
+            "channel": ["UPI", "UPI", "bank"],
+            "narration": [None, None, "rent"],
+            "vpa": ["p@upi", None, None],
+            "partial_record": ["yes", "", "0"],
+        }
+    )
+    frame, breakdown = normalize_df(df)
+    # Row 1 fails merchant_id first, so it is not also counted as INVALID_TS/AMOUNT.
+    assert breakdown == {"MISSING_REQUIRED_FIELD": 1}
+    assert frame.index.tolist() == [0, 2]
+    assert frame["amount"].dtype == "float64"
+    assert str(frame["event_ts"].dt.tz) == "UTC+05:30"
+    assert frame["direction"].tolist() == ["credit", "debit"]
+    assert frame["channel"].tolist() == ["UPI", "BANK"]
+    assert frame["direction"].dtype == "category"
+    assert frame["raw_counterparty_token"].tolist() == ["p@upi", None]
+    assert frame["raw_narration"].tolist() == [None, "rent"]
+    assert frame["partial_record"].tolist() == [True, False]
+
+
+def test_canonical_txn_checks_amount_and_coerces_enums():
+    from datetime import datetime
+
+    from cashflow_ingest.api.schemas import CanonicalTxn, Channel, Direction
+
+    txn = CanonicalTxn(
+        subject_ref="s1",
+        merchant_id="m1",
+        event_ts=datetime(2025, 1, 1),
+        amount=5,
+        direction="credit",
+        channel="UPI",
+    )
+    assert txn.amount == 5.0 and isinstance(txn.amount, float)
+    assert txn.direction is Direction.credit
+    assert txn.channel is Channel.UPI
+    try:
+        CanonicalTxn(
+            subject_ref="s1",
+            merchant_id="m1",
+            event_ts=datetime(2025, 1, 1),
+            amount=0,
+            direction=Direction.credit,
+            channel=Channel.UPI,
+        )
+        assert False, "expected amount error"
+    except ValueError as e:
+        assert "amount must be > 0" in str(e)
+
+
+def test_canonical_txn_validates_field_types():
+    from datetime import datetime
+
+    from cashflow_ingest.api.schemas import CanonicalTxn
+
+    base = dict(
+        subject_ref="s1",
+        merchant_id="m1",
+        event_ts=datetime(2025, 1, 1),
+        amount=5,
+        direction="credit",
+        channel="UPI",
+    )
+    txn = CanonicalTxn(**{**base, "event_ts": "2025-01-01T10:00:00+05:30"})
+    assert txn.event_ts == datetime.fromisoformat("2025-01-01T10:00:00+05:30")
+    for bad in (
+        {"merchant_id": 7},
+        {"subject_ref": None},
+        {"event_ts": 1735689600},
+        {"raw_narration": 3.5},
+        {"partial_record": "yes"},
+    ):
+        with pytest.raises(ValueError):
+            CanonicalTxn(**{**base, **bad})
+
+
+def test_normalize_df_amounts_from_arrow_strings():
+    base = {
+        "merchant_id": ["m1", "m1"],
+        "ts": ["2025-01-01T00:00:00+05:30", "2025-01-01T01:00:00+05:30"],
+        "direction": ["credit", "credit"],
+        "channel": ["UPI", "UPI"],
+    }
+    clean = pd.DataFrame({**base, "amount": ["0.1", "1e3"]}, dtype="str")
+    frame, breakdown = normalize_df(clean)
+    assert frame["amount"].tolist() == [0.1, 1000.0]
+    assert breakdown == {}
+
+    # One bad cell must not fail the column: only that row is rejected.
+    mixed = pd.DataFrame({**base, "amount": [" 5 ", "abc"]}, dtype="str")
+    frame, breakdown = normalize_df(mixed)
+    assert frame["amount"].tolist() == [5.0]
+    assert breakdown == {"INVALID_AMOUNT": 1}
+
+
+def test_normalize_df_repeated_timestamps():
+    ts = ["2025-01-01T09:00:00+05:30", "not-a-ts", "2025-01-01T09:00:00+05:30", "2025-01-02T10:30:00+05:30"]
+    df = pd.DataFrame(
+        {
+            "merchant_id": ["m1"] * 4,
+            "ts": ts,
+            "amount": ["10"] * 4,
+            "direction": ["credit"] * 4,
+            "channel": ["UPI"] * 4,
+        },
+        index=[10, 11, 12, 13],
+        dtype="str",
+    )
+    frame, breakdown = normalize_df(df)
+    assert breakdown == {"INVALID_TS": 1}
+    assert frame.index.tolist() == [10, 12, 13]
+    assert [t.isoformat() for t in frame["event_ts"]] == [ts[0], ts[2], ts[3]]
+
+
+def test_normalize_df_non_iso_timestamps_use_inferred_format():
+    ts = ["11/05/2025 10:00", "11/06/2025 09:30", "2025-11-07T08:00:00", "not-a-ts"]
+    df = pd.DataFrame(
+        {
+            "merchant_id": ["m1"] * 4,
+            "ts": ts,
+            "amount": ["10"] * 4,
+            "direction": ["credit"] * 4,
+            "channel": ["UPI"] * 4,
+        },
+        dtype="str",
+    )
+    frame, breakdown = normalize_df(df)
+    assert breakdown == {"INVALID_TS": 1}
+    assert [t.isoformat() for t in frame["event_ts"]] == [
+        "2025-11-05T10:00:00",
+        "2025-11-06T09:30:00",
+        "2025-11-07T08:00:00",
+    ]
+
+
+def test_normalize_df_mixed_offsets_keep_their_own_offset():
+    ts = ["2025-01-01T09:00:00+05:30", "2025-01-01T09:00:00+00:00", "2025-01-02T23:30:00-04:00"]
+    rows = [
+        {"merchant_id": "m1", "ts": t, "amount": "10", "direction": "credit", "channel": "UPI"} for t in ts
+    ]
+    # Same result whichever offset comes first
+    for ordered in (rows, rows[::-1]):
+        events, breakdown, _ = normalize_df_to_events(_df(ordered), subject_ref="s1")
+        assert breakdown == {}
+        assert sorted(e.event_ts.isoformat() for e in events) == sorted(ts)
+
+
+def test_normalize_df_accepts_typed_columns():
+    # Already-typed ts/amount columns (e.g. JSON feed numbers) skip parsing.
+    ts = pd.to_datetime(["2025-01-01T09:00:00+05:30", "2025-01-02T09:00:00+05:30"])
+    df = pd.DataFrame(
+        {
+            "merchant_id": ["m1", "m1"],
+            "ts": ts,
+            "amount": [12.5, 0],
+            "direction": ["credit", "debit"],
+            "channel": ["UPI", "CARD"],
+        }
+    )
+    frame, breakdown = normalize_df(df)
+    assert breakdown == {"INVALID_AMOUNT": 1}
+    assert frame["amount"].tolist() == [12.5]
+    assert frame["event_ts"].tolist() == [ts[0]]
+
+
+def test_normalize_df_to_events_chunked_matches_whole():
+    df = pd.DataFrame(
+        {
+            "merchant_id": ["m1", "", "m1", "m1", "m1"],
+            "ts": [
+                "2025-01-01T00:00:00+05:30",
+                "2025-01-01T00:00:00+05:30",
+                "bad",
+                "2025-01-02T00:00:00+05:30",
+                "2025-01-03T00:00:00+05:30",
+            ],
+            "amount": ["1", "2", "3", "-4", "5"],
+            "direction": ["credit"] * 5,
+            "channel": ["UPI"] * 5,
+        },
+        dtype="str",
+    )
+    events, breakdown, indices = normalize_df_to_events(df, subject_ref="s1")
+
+    chunks = list(normalize_df_to_events_chunked(df, subject_ref="s1", chunk_size=2))
+    assert len(chunks) == 3
+    assert [e for c in chunks for e in c[0]] == events
+    assert [i for c in chunks for i in c[2]] == indices == [0, 4]
+    totals = Counter()
+    for _, chunk_breakdown, _ in chunks:
+        totals.update(chunk_breakdown)
+    assert totals == breakdown
+
+
+def test_normalize_df_missing_values_in_object_columns():
+    # JSON feeds produce object columns mixing str, None, NaN and numbers.
+    df = pd.DataFrame(
+        {
+            "merchant_id": ["m1", "   ", None, float("nan"), 7],
+            "ts": ["2025-01-01T00:00:00+05:30"] * 5,
+            "amount": ["10", "10", "10", "10", "10"],
+            "direction": ["credit"] * 5,
+            "channel": ["UPI"] * 5,
+        },
+        dtype=object,
+    )
+    frame, breakdown = normalize_df(df)
+    assert breakdown == {"MISSING_REQUIRED_FIELD": 3}
+    assert frame["merchant_id"].tolist() == ["m1", "7"]
@@ -0,0 +1,62 @@
+import pickle
+from datetime import datetime, timezone
+
+import pandas as pd
+
+from cashflow_ingest.api.schemas import CanonicalTxn, Channel, Direction
+from cashflow_ingest.ingest.pipeline.semantic_classifier import (
+    classify_role_purpose,
+    classify_role_purpose_bulk,
+)
+
+
+def _txn(category: str | None, narration: str | None) -> CanonicalTxn:
+    return CanonicalTxn(
+        subject_ref="s1",
+        merchant_id="m1",
+        event_ts=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        amount=10.0,
+        direction=Direction.credit,
+        channel=Channel.UPI,
+        raw_category=category,
+        raw_narration=narration,
+    )
+
+
+def test_classify_role_purpose_first_group_wins():
+    sem = classify_role_purpose(_txn("Stock", "owner capital infusion"))
+    assert (sem.role_class, sem.purpose_class) == ("OWNER", "OWNER_TRANSFER")
+    sem = classify_role_purpose(_txn(None, None))
+    assert (sem.role_class, sem.purpose_class) == ("UNKNOWN", "UNKNOWN")
+
+
+def test_classify_role_purpose_bulk_matches_scalar():
+    rows = [
+        ("Stock", "owner capital infusion"),
+        ("SUPPLIER", None),
+        (None, "electricity bill"),
+        ("Refund", "gateway settlement"),
+        (None, "pos sale"),
+        ("insurance", ""),
+        (None, None),
+        ("misc", "transfer"),
+    ]
+    frame = pd.DataFrame(
+        {
+            "raw_category": [c for c, _ in rows],
+            "raw_narration": [n for _, n in rows],
+        },
+        index=range(100, 100 + len(rows)),
+        dtype=object,
+    )
+    roles, purposes = classify_role_purpose_bulk(frame)
+    assert roles.index.equals(frame.index)
+    expected = [classify_role_purpose(_txn(c, n)) for c, n in rows]
+    assert roles.tolist() == [s.role_class for s in expected]
+    assert purposes.tolist() == [s.purpose_class for s in expected]
+
+
+def test_txn_semantic_is_slotted_and_picklable():
+    sem = classify_role_purpose(_txn("Stock", None))
+    assert not hasattr(sem, "__dict__")
+    assert pickle.loads(pickle.dumps(sem)) == sem